@@ -0,0 +1,34 @@
+"""
+Shared helpers for the benchmark example scripts.
+"""
+
+import json
+from pathlib import Path
+
+# orjson is optional; it only speeds up writing the results file
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _to_jsonable(obj):
+    """Fallback for values neither serializer handles natively"""
+    if hasattr(obj, 'tolist'):  # NumPy scalars and arrays
+        return obj.tolist()
+    if hasattr(obj, '__dict__'):  # the result dataclasses are flat
+        return obj.__dict__
+    return str(obj)
+
+
+def save_json(path: Path, data: dict):
+    """Write results as indented JSON, using orjson when available
+
+    orjson serializes dataclasses natively, so results need no asdict() copy.
+    """
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, default=_to_jsonable,
+                                      option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2, default=_to_jsonable)
@@ -13,13 +13,16 @@ Requirements:
 """
 
 import argparse
-import json
 import os
 import platform
+import re
+import shutil
 import subprocess
 import sys
+import tempfile
 import time
-from dataclasses import dataclass, asdict
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -32,6 +35,22 @@ except ImportError:
     MZPEAK_PYTHON = False
     print("Note: mzpeak Python bindings not available, using CLI")
 
+from _bench_io import save_json
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+# Invoking the prebuilt binary skips cargo's workspace resolution overhead
+PREBUILT_CONVERTER = REPO_ROOT / "target" / "release" / "mzpeak-convert"
+
+# Conversion CLI output lines mapped to the stat they report (log prefixes
+# vary, so these are searched, not anchored)
+PATTERNS = [
+    (re.compile(r'Total spectra:\s*([\d,]+)'), 'spectra_count'),
+    (re.compile(r'MS1:\s*([\d,]+)'), 'ms1_spectra'),
+    (re.compile(r'MS2:\s*([\d,]+)'), 'ms2_spectra'),
+    (re.compile(r'Total peaks:\s*([\d,]+)'), 'peak_count'),
+]
+
 
 @dataclass
 class SystemInfo:
@@ -87,25 +106,10 @@ def get_system_info() -> SystemInfo:
     """Collect system information for reproducibility"""
     import multiprocessing
 
-    # Get memory info
+    # Get memory info (in-process on both macOS and Linux; no sysctl spawn)
     try:
-        if platform.system() == "Darwin":
-            # macOS
-            result = subprocess.run(
-                ["sysctl", "-n", "hw.memsize"],
-                capture_output=True, text=True
-            )
-            memory_bytes = int(result.stdout.strip())
-            memory_gb = memory_bytes / (1024**3)
-        else:
-            # Linux
-            with open("/proc/meminfo") as f:
-                for line in f:
-                    if line.startswith("MemTotal"):
-                        memory_kb = int(line.split()[1])
-                        memory_gb = memory_kb / (1024**2)
-                        break
-    except Exception:
+        memory_gb = (os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')) / (1024**3)
+    except (ValueError, AttributeError, OSError):
         memory_gb = 0.0
 
     # Get CPU info
@@ -132,16 +136,45 @@ def get_system_info() -> SystemInfo:
     )
 
 
-def convert_mzml_to_mzpeak(input_path: str, output_path: str) -> ConversionResult:
-    """Convert mzML to mzPeak and collect metrics"""
-    input_path = Path(input_path)
-    output_path = Path(output_path)
+def directory_size(root: Path) -> int:
+    """Total size of all files under root
+
+    Uses os.scandir so each entry's type and size come from the cached
+    DirEntry instead of building a Path and issuing a fresh stat per file.
+    """
+    total = 0
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
+def conversion_command(input_path: Path, output_path: Path) -> list:
+    """Build the CLI conversion command
+
+    Prefers the prebuilt release binary over `cargo run`, and on Linux pins
+    the process to NUMA node 0 with numactl (when installed) so CPU and
+    memory placement don't add noise between runs.
+    """
+    args = ["convert", str(input_path.resolve()), str(output_path.resolve())]
+    if PREBUILT_CONVERTER.exists():
+        cmd = [str(PREBUILT_CONVERTER), *args]
+    else:
+        cmd = ["cargo", "run", "--release", "--bin", "mzpeak-convert", "--", *args]
 
-    input_size = input_path.stat().st_size
+    numactl = shutil.which("numactl") if platform.system() == "Linux" else None
+    if numactl:
+        cmd = [numactl, "--cpunodebind=0", "--membind=0", *cmd]
+    return cmd
 
-    print(f"\nConverting {input_path.name}...")
-    print(f"  Input size: {input_size / (1024**3):.2f} GB")
 
+def run_conversion(input_path: Path, output_path: Path) -> tuple:
+    """Run the conversion and return (spectra, ms1, ms2, peaks, seconds)"""
     start_time = time.perf_counter()
 
     if MZPEAK_PYTHON:
@@ -152,38 +185,80 @@ def convert_mzml_to_mzpeak(input_path: str, output_path: str) -> ConversionResul
         ms2_spectra = stats.ms2_spectra
         peak_count = stats.peak_count
     else:
-        # Use CLI
-        result = subprocess.run(
-            ["cargo", "run", "--release", "--bin", "mzpeak-convert", "--",
-             "convert", str(input_path), str(output_path)],
-            capture_output=True, text=True, cwd=input_path.parent.parent
+        # Use CLI; stream output line by line so large logs are never
+        # buffered in full and progress is parsed as it arrives
+        stats = dict.fromkeys((key for _, key in PATTERNS), 0)
+        tail = deque(maxlen=20)  # last lines, reported on failure
+
+        proc = subprocess.Popen(
+            conversion_command(input_path, output_path),
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            bufsize=1, text=True, cwd=REPO_ROOT
         )
-        if result.returncode != 0:
-            print(f"Conversion failed: {result.stderr}")
+        for line in proc.stdout:
+            tail.append(line)
+            for pattern, key in PATTERNS:
+                m = pattern.search(line)
+                if m:
+                    stats[key] = int(m.group(1).replace(',', ''))
+                    break
+
+        if proc.wait() != 0:
+            print(f"Conversion failed: {''.join(tail)}")
             sys.exit(1)
 
-        # Parse output for stats
-        output = result.stdout + result.stderr
-        spectra_count = 0
-        ms1_spectra = 0
-        ms2_spectra = 0
-        peak_count = 0
-
-        for line in output.split('\n'):
-            if 'Total spectra:' in line:
-                spectra_count = int(line.split(':')[1].strip().replace(',', ''))
-            elif 'MS1:' in line:
-                ms1_spectra = int(line.split(':')[1].strip().replace(',', ''))
-            elif 'MS2:' in line:
-                ms2_spectra = int(line.split(':')[1].strip().replace(',', ''))
-            elif 'Total peaks:' in line:
-                peak_count = int(line.split(':')[1].strip().replace(',', ''))
+        spectra_count = stats['spectra_count']
+        ms1_spectra = stats['ms1_spectra']
+        ms2_spectra = stats['ms2_spectra']
+        peak_count = stats['peak_count']
 
     conversion_time = time.perf_counter() - start_time
 
+    return spectra_count, ms1_spectra, ms2_spectra, peak_count, conversion_time
+
+
+def convert_mzml_to_mzpeak(input_path: str, output_path: str,
+                           tmpfs: bool = False) -> ConversionResult:
+    """Convert mzML to mzPeak and collect metrics
+
+    With tmpfs=True the input is first copied to /dev/shm (untimed) so the
+    measurement isolates decoding from disk read bandwidth.
+    """
+    input_path = Path(input_path)
+    output_path = Path(output_path)
+
+    input_size = input_path.stat().st_size
+
+    print(f"\nConverting {input_path.name}...")
+    print(f"  Input size: {input_size / (1024**3):.2f} GB")
+
+    source_path = input_path
+    staging_dir = None
+    if tmpfs:
+        shm = Path("/dev/shm")
+        if shm.is_dir() and input_path.resolve().parent == shm.resolve():
+            print(f"  Input already in {shm}, converting in place")
+        elif shm.is_dir():
+            # A private directory, so existing files and concurrent runs are
+            # never overwritten or deleted
+            staging_dir = tempfile.mkdtemp(prefix="mzpeak-bench-", dir=shm)
+            source_path = Path(staging_dir) / input_path.name
+            print(f"  Staging input in {source_path}")
+        else:
+            print("  Note: /dev/shm not available, converting from disk")
+
+    try:
+        if staging_dir is not None:
+            shutil.copyfile(input_path, source_path)
+        spectra_count, ms1_spectra, ms2_spectra, peak_count, conversion_time = \
+            run_conversion(source_path, output_path)
+    finally:
+        if staging_dir is not None:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
     # Get output size
     if output_path.is_dir():
-        output_size = sum(f.stat().st_size for f in output_path.rglob('*') if f.is_file())
+        output_size = directory_size(output_path)
     else:
         output_size = output_path.stat().st_size
 
@@ -252,7 +327,7 @@ def benchmark_mzpeak_queries(mzpeak_path: str, spectra_count: int) -> list:
         operation="random_spectrum_access",
         time_seconds=elapsed,
         time_ms=elapsed * 1000,
-        result_count=len(spectrum.peaks) if spectrum else 0
+        result_count=spectrum.num_peaks if spectrum else 0
     ))
     print(f"  Random spectrum access (id={target_id}): {elapsed*1000:.2f} ms")
 
@@ -268,11 +343,12 @@ def benchmark_mzpeak_queries(mzpeak_path: str, spectra_count: int) -> list:
     ))
     print(f"  MS2 filter: {elapsed*1000:.2f} ms ({len(ms2_spectra):,} spectra)")
 
-    # Full iteration (count peaks)
+    # Full iteration (count peaks). num_peaks reads the length on the Rust
+    # side; len(spec.peaks) would build a Peak object per peak just to count.
     start = time.perf_counter()
     total_peaks = 0
     for spec in reader.iter_spectra():
-        total_peaks += len(spec.peaks)
+        total_peaks += spec.num_peaks
     elapsed = time.perf_counter() - start
     results.append(QueryResult(
         operation="full_iteration",
@@ -389,6 +465,9 @@ def main():
                        help="Output directory for results")
     parser.add_argument("--json", "-j", help="Output JSON file for results",
                        default="benchmark_results.json")
+    parser.add_argument("--tmpfs", action="store_true",
+                       help="Copy the input to /dev/shm before converting to "
+                            "isolate decode speed from disk bandwidth")
 
     args = parser.parse_args()
 
@@ -412,7 +491,8 @@ def main():
     print(f"Memory: {system_info.memory_gb} GB, Cores: {system_info.cpu_cores}")
 
     # Run conversion benchmark
-    conversion_result = convert_mzml_to_mzpeak(str(input_path), str(mzpeak_output))
+    conversion_result = convert_mzml_to_mzpeak(str(input_path), str(mzpeak_output),
+                                               tmpfs=args.tmpfs)
 
     # Run query benchmarks
     query_results = benchmark_mzpeak_queries(str(mzpeak_output), conversion_result.spectra_count)
@@ -433,15 +513,12 @@ def main():
 
     # Save JSON results
     json_path = output_dir / args.json
-    with open(json_path, 'w') as f:
-        # Convert dataclasses to dicts
-        json_data = {
-            "system_info": asdict(results.system_info),
-            "conversion": asdict(results.conversion),
-            "queries": [asdict(q) for q in results.queries],
-            "duckdb_queries": [asdict(q) for q in results.duckdb_queries]
-        }
-        json.dump(json_data, f, indent=2)
+    save_json(json_path, {
+        "system_info": results.system_info,
+        "conversion": results.conversion,
+        "queries": results.queries,
+        "duckdb_queries": results.duckdb_queries
+    })
     print(f"\nResults saved to: {json_path}")
 
     # Generate LaTeX table snippet
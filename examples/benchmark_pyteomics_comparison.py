@@ -14,16 +14,17 @@ Requirements:
 
 import argparse
 import gc
-import json
-import statistics
+import operator
 import sys
 import time
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, List, Optional
 
 import numpy as np
 
+from _bench_io import save_json
+
 
 @dataclass
 class TimingResult:
@@ -39,27 +40,47 @@ class TimingResult:
 
 
 def time_operation(func, runs: int = 5, warmup: int = 1) -> tuple:
-    """Time an operation multiple times and return statistics"""
+    """Time an operation multiple times and return statistics
+
+    Garbage from setup and warmup is collected once up front and the
+    collector is disabled for the timed runs, so GC pauses are not
+    attributed to the operation being measured.
+    """
     # Warmup
     for _ in range(warmup):
-        result = func()
-        gc.collect()
+        func()
 
     # Timed runs
-    times = []
+    times = [0.0] * runs
     final_result = None
-    for _ in range(runs):
-        gc.collect()
-        start = time.perf_counter()
-        final_result = func()
-        elapsed = time.perf_counter() - start
-        times.append(elapsed)
+    gc.collect()
+    gc.disable()
+    try:
+        for i in range(runs):
+            start = time.perf_counter_ns()
+            final_result = func()
+            times[i] = (time.perf_counter_ns() - start) * 1e-9
+    finally:
+        gc.enable()
 
     return times, final_result
 
 
-def benchmark_mzpeak(mzpeak_path: str, num_spectra: int, runs: int = 5) -> List[TimingResult]:
-    """Benchmark mzPeak reader operations"""
+def _stats(times) -> tuple:
+    """Mean, sample standard deviation, min and max of run times in one pass"""
+    a = np.asarray(times)
+    std = a.std(ddof=1) if a.size > 1 else 0.0
+    return float(a.mean()), float(std), float(a.min()), float(a.max())
+
+
+def benchmark_mzpeak(mzpeak_path: str, runs: int = 5,
+                     legacy: bool = False) -> List[TimingResult]:
+    """Benchmark mzPeak reader operations
+
+    Must run before anything else in this process opens the file, so the
+    cold open does not find the footer already cached. The spectrum count is
+    taken from that open.
+    """
     results = []
 
     try:
@@ -70,86 +91,195 @@ def benchmark_mzpeak(mzpeak_path: str, num_spectra: int, runs: int = 5) -> List[
 
     print("\n  === mzPeak ===")
 
-    # File open + metadata
-    def open_metadata():
-        reader = mzpeak.MzPeakReader(mzpeak_path)
-        summary = reader.summary()
-        return summary.num_spectra
+    # Cold file open + metadata (one-shot, before any reader exists)
+    def cold_open():
+        r = mzpeak.MzPeakReader(mzpeak_path)
+        return r.summary().num_spectra
 
-    times, count = time_operation(open_metadata, runs=runs)
+    times, num_spectra = time_operation(cold_open, runs=1, warmup=0)
+    mean, std, mn, mx = _stats(times)
     results.append(TimingResult(
         operation="file_open_metadata",
         tool="mzpeak",
-        mean_seconds=statistics.mean(times),
-        std_seconds=statistics.stdev(times) if len(times) > 1 else 0,
-        min_seconds=min(times),
-        max_seconds=max(times),
+        mean_seconds=mean,
+        std_seconds=std,
+        min_seconds=mn,
+        max_seconds=mx,
+        runs=1,
+        result_count=num_spectra
+    ))
+    print(f"    Cold file open + metadata: {mean*1000:.2f} ms")
+
+    # One reader shared by every remaining operation
+    reader = mzpeak.MzPeakReader(mzpeak_path)
+
+    # Metadata access on the open reader
+    def warm_metadata():
+        return reader.summary().num_spectra
+
+    times, count = time_operation(warm_metadata, runs=runs)
+    mean, std, mn, mx = _stats(times)
+    results.append(TimingResult(
+        operation="metadata_access",
+        tool="mzpeak",
+        mean_seconds=mean,
+        std_seconds=std,
+        min_seconds=mn,
+        max_seconds=mx,
         runs=runs,
         result_count=count
     ))
-    print(f"    File open + metadata: {statistics.mean(times)*1000:.2f} ± {statistics.stdev(times)*1000:.2f} ms")
+    print(f"    Metadata access (open reader): {mean*1000:.2f} ± {std*1000:.2f} ms")
 
     # Random spectrum access
     target_id = num_spectra // 2
-    reader = mzpeak.MzPeakReader(mzpeak_path)
 
     def random_access():
         return reader.get_spectrum(target_id)
 
     times, spec = time_operation(random_access, runs=runs)
+    mean, std, mn, mx = _stats(times)
     results.append(TimingResult(
         operation="random_spectrum_access",
         tool="mzpeak",
-        mean_seconds=statistics.mean(times),
-        std_seconds=statistics.stdev(times) if len(times) > 1 else 0,
-        min_seconds=min(times),
-        max_seconds=max(times),
+        mean_seconds=mean,
+        std_seconds=std,
+        min_seconds=mn,
+        max_seconds=mx,
         runs=runs,
-        result_count=len(spec.peaks) if spec else 0
+        result_count=spec.num_peaks if spec else 0
     ))
-    print(f"    Random access (id={target_id}): {statistics.mean(times)*1000:.2f} ± {statistics.stdev(times)*1000:.2f} ms")
+    print(f"    Random access (id={target_id}): {mean*1000:.2f} ± {std*1000:.2f} ms")
 
     # MS2 filtering
     def ms2_filter():
         return reader.spectra_by_ms_level(2)
 
     times, ms2_specs = time_operation(ms2_filter, runs=runs)
+    mean, std, mn, mx = _stats(times)
     results.append(TimingResult(
         operation="ms2_filter",
         tool="mzpeak",
-        mean_seconds=statistics.mean(times),
-        std_seconds=statistics.stdev(times) if len(times) > 1 else 0,
-        min_seconds=min(times),
-        max_seconds=max(times),
+        mean_seconds=mean,
+        std_seconds=std,
+        min_seconds=mn,
+        max_seconds=mx,
         runs=runs,
         result_count=len(ms2_specs)
     ))
-    print(f"    MS2 filter: {statistics.mean(times)*1000:.2f} ± {statistics.stdev(times)*1000:.2f} ms ({len(ms2_specs):,} spectra)")
-
-    # Count all MS2 peaks (iteration)
-    def count_ms2_peaks():
-        total = 0
-        for spec in reader.spectra_by_ms_level(2):
-            total += len(spec.peaks)
-        return total
+    print(f"    MS2 filter: {mean*1000:.2f} ± {std*1000:.2f} ms ({len(ms2_specs):,} spectra)")
+
+    # Count all MS2 peaks: native column scan, or per-spectrum iteration with --legacy
+    if legacy:
+        def count_ms2_peaks():
+            total = 0
+            for spec in reader.spectra_by_ms_level(2):
+                total += spec.num_peaks
+            return total
+    else:
+        def count_ms2_peaks():
+            return reader.peak_count_by_ms_level(2)
 
     times, peak_count = time_operation(count_ms2_peaks, runs=runs)
+    mean, std, mn, mx = _stats(times)
     results.append(TimingResult(
         operation="count_ms2_peaks",
         tool="mzpeak",
-        mean_seconds=statistics.mean(times),
-        std_seconds=statistics.stdev(times) if len(times) > 1 else 0,
-        min_seconds=min(times),
-        max_seconds=max(times),
+        mean_seconds=mean,
+        std_seconds=std,
+        min_seconds=mn,
+        max_seconds=mx,
         runs=runs,
         result_count=peak_count
     ))
-    print(f"    Count MS2 peaks: {statistics.mean(times):.2f} ± {statistics.stdev(times):.2f} s ({peak_count:,} peaks)")
+    print(f"    Count MS2 peaks: {mean:.2f} ± {std:.2f} s ({peak_count:,} peaks)")
+
+    # Filter and count in one pass, the same work as a full mzML scan
+    def ms2_scan():
+        return sum(spec.num_peaks for spec in reader.spectra_by_ms_level(2))
+
+    times, peak_count = time_operation(ms2_scan, runs=runs)
+    results.append(_scan_result("mzpeak", times, peak_count))
+    mean, std = _stats(times)[:2]
+    print(f"    MS2 scan (filter + count): {mean:.2f} ± {std:.2f} s ({peak_count:,} peaks)")
 
     return results
 
 
-def benchmark_pyteomics(mzml_path: str, num_spectra: int, runs: int = 3) -> List[TimingResult]:
+def _scan_pyteomics(reader) -> int:
+    """Single pass over an indexed pyteomics reader counting MS2 peaks.
+
+    The reader is rewound with reset() so its offset index is reused rather
+    than rebuilt. Spectra are fully decoded while iterating, so filtering and
+    counting cannot be timed apart; the pass is reported as one operation.
+    """
+    getter = operator.itemgetter('ms level', 'm/z array')
+    peak_count = 0
+
+    reader.reset()
+    for spec in reader:
+        try:
+            ms_level, mz = getter(spec)
+        except KeyError:
+            ms_level, mz = spec.get('ms level', 1), ()
+        if ms_level == 2:
+            peak_count += len(mz)
+
+    return peak_count
+
+
+def _scan_pyteomics_prefiltered(mzml_path: str, reader) -> int:
+    """Like _scan_pyteomics, but skips full parsing of non-MS2 spectra.
+
+    Spectrum elements are streamed with lxml and only those whose ms level
+    cvParam (MS:1000511) is "2" are handed to pyteomics' element parser to
+    decode the m/z array. Processed elements are cleared to keep memory flat.
+    """
+    from lxml import etree
+
+    peak_count = 0
+
+    for _, elem in etree.iterparse(mzml_path, events=('end',), tag='{*}spectrum'):
+        level = elem.find('{*}cvParam[@accession="MS:1000511"]')
+        if level is not None and level.get('value') == '2':
+            spec = reader._get_info_smart(elem)
+            peak_count += len(spec.get('m/z array', ()))
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+    return peak_count
+
+
+def _scan_pymzml(mzml_path: str) -> int:
+    """Single pass over an mzML file with pymzml; see _scan_pyteomics."""
+    import pymzml
+
+    peak_count = 0
+    for spec in pymzml.run.Reader(mzml_path):
+        if spec.ms_level == 2:
+            peak_count += len(spec.mz)
+
+    return peak_count
+
+
+def _scan_result(tool: str, times, peak_count: int) -> TimingResult:
+    """TimingResult for the ms2_scan operation (MS2 filter + peak count in one pass)"""
+    mean, std, mn, mx = _stats(times)
+    return TimingResult(
+        operation="ms2_scan",
+        tool=tool,
+        mean_seconds=mean,
+        std_seconds=std,
+        min_seconds=mn,
+        max_seconds=mx,
+        runs=len(times),
+        result_count=peak_count
+    )
+
+
+def benchmark_pyteomics(mzml_path: str, num_spectra: int, runs: int = 3,
+                        lxml_prefilter: bool = False) -> List[TimingResult]:
     """Benchmark pyteomics mzML reader"""
     results = []
 
@@ -163,93 +293,77 @@ def benchmark_pyteomics(mzml_path: str, num_spectra: int, runs: int = 3) -> List
 
     # File open (builds index)
     def open_file():
-        reader = mzml.MzML(mzml_path)
+        reader = mzml.MzML(mzml_path, use_index=True)
         # Access metadata
         _ = len(reader)
         return len(reader)
 
     times, count = time_operation(open_file, runs=runs, warmup=0)
+    mean, std, mn, mx = _stats(times)
     results.append(TimingResult(
         operation="file_open_metadata",
         tool="pyteomics",
-        mean_seconds=statistics.mean(times),
-        std_seconds=statistics.stdev(times) if len(times) > 1 else 0,
-        min_seconds=min(times),
-        max_seconds=max(times),
+        mean_seconds=mean,
+        std_seconds=std,
+        min_seconds=mn,
+        max_seconds=mx,
         runs=runs,
         result_count=count
     ))
-    print(f"    File open + index: {statistics.mean(times):.2f} ± {statistics.stdev(times):.2f} s")
+    print(f"    File open + index: {mean:.2f} ± {std:.2f} s")
+
+    # One indexed reader is shared by all remaining operations, so the offset
+    # index is built once instead of once per timed closure
+    reader = mzml.MzML(mzml_path, use_index=True)
 
     # Random spectrum access (using index)
-    reader = mzml.MzML(mzml_path)
     target_idx = num_spectra // 2
     target_id = f"scan={target_idx}"
 
+    # Resolve the lookup once: native ids often don't follow "scan=N" (e.g.
+    # Thermo's "controllerType=0 controllerNumber=1 scan=N"), in which case
+    # fall back to positional access instead of raising KeyError every run
+    if target_id in reader.index['spectrum']:
+        accessor, key = reader.get_by_id, target_id
+    else:
+        accessor, key = reader.__getitem__, target_idx
+
     def random_access():
-        # pyteomics uses string-based indexing
-        try:
-            return reader.get_by_id(target_id)
-        except KeyError:
-            # Try index-based access
-            return reader[target_idx]
+        return accessor(key)
 
     times, spec = time_operation(random_access, runs=runs)
+    mean, std, mn, mx = _stats(times)
     peak_count = len(spec.get('m/z array', [])) if spec else 0
     results.append(TimingResult(
         operation="random_spectrum_access",
         tool="pyteomics",
-        mean_seconds=statistics.mean(times),
-        std_seconds=statistics.stdev(times) if len(times) > 1 else 0,
-        min_seconds=min(times),
-        max_seconds=max(times),
+        mean_seconds=mean,
+        std_seconds=std,
+        min_seconds=mn,
+        max_seconds=mx,
         runs=runs,
         result_count=peak_count
     ))
-    print(f"    Random access (idx={target_idx}): {statistics.mean(times)*1000:.2f} ± {statistics.stdev(times)*1000:.2f} ms")
-
-    # MS2 filtering (requires iteration)
-    def ms2_filter():
-        ms2_count = 0
-        for spec in mzml.MzML(mzml_path):
-            if spec.get('ms level', 1) == 2:
-                ms2_count += 1
-        return ms2_count
-
-    # Only 1 run for slow operations
-    times, ms2_count = time_operation(ms2_filter, runs=1, warmup=0)
-    results.append(TimingResult(
-        operation="ms2_filter",
-        tool="pyteomics",
-        mean_seconds=statistics.mean(times),
-        std_seconds=0,
-        min_seconds=min(times),
-        max_seconds=max(times),
-        runs=1,
-        result_count=ms2_count
-    ))
-    print(f"    MS2 filter (full scan): {statistics.mean(times):.2f} s ({ms2_count:,} spectra)")
-
-    # Count all MS2 peaks
-    def count_ms2_peaks():
-        total = 0
-        for spec in mzml.MzML(mzml_path):
-            if spec.get('ms level', 1) == 2:
-                total += len(spec.get('m/z array', []))
-        return total
+    print(f"    Random access (idx={target_idx}): {mean*1000:.2f} ± {std*1000:.2f} ms")
 
-    times, peak_count = time_operation(count_ms2_peaks, runs=1, warmup=0)
-    results.append(TimingResult(
-        operation="count_ms2_peaks",
-        tool="pyteomics",
-        mean_seconds=statistics.mean(times),
-        std_seconds=0,
-        min_seconds=min(times),
-        max_seconds=max(times),
-        runs=1,
-        result_count=peak_count
-    ))
-    print(f"    Count MS2 peaks: {statistics.mean(times):.2f} s ({peak_count:,} peaks)")
+    # MS2 filtering + peak counting, one full scan per run
+    if lxml_prefilter:
+        try:
+            import lxml  # noqa: F401
+        except ImportError:
+            print("    lxml not available, using the full pyteomics scan")
+            lxml_prefilter = False
+    if lxml_prefilter:
+        def scan():
+            return _scan_pyteomics_prefiltered(mzml_path, reader)
+    else:
+        def scan():
+            return _scan_pyteomics(reader)
+
+    times, peak_count = time_operation(scan, runs=runs, warmup=0)
+    results.append(_scan_result("pyteomics", times, peak_count))
+    mean, std = _stats(times)[:2]
+    print(f"    MS2 scan (filter + count): {mean:.2f} ± {std:.2f} s ({peak_count:,} peaks)")
 
     return results
 
@@ -277,139 +391,104 @@ def benchmark_pymzml(mzml_path: str, num_spectra: int, runs: int = 3) -> List[Ti
 
     # pymzml is slow, fewer runs
     times, count = time_operation(open_file, runs=1, warmup=0)
+    mean, std, mn, mx = _stats(times)
     results.append(TimingResult(
         operation="file_open_metadata",
         tool="pymzml",
-        mean_seconds=statistics.mean(times),
-        std_seconds=0,
-        min_seconds=min(times),
-        max_seconds=max(times),
+        mean_seconds=mean,
+        std_seconds=std,
+        min_seconds=mn,
+        max_seconds=mx,
         runs=1,
         result_count=count
     ))
-    print(f"    File iteration (count): {statistics.mean(times):.2f} s")
+    print(f"    File iteration (count): {mean:.2f} s")
 
-    # MS2 filtering
-    def ms2_filter():
-        ms2_count = 0
-        for spec in pymzml.run.Reader(mzml_path):
-            if spec.ms_level == 2:
-                ms2_count += 1
-        return ms2_count
+    # MS2 filtering + peak counting, one full scan per run
+    times, peak_count = time_operation(lambda: _scan_pymzml(mzml_path), runs=runs, warmup=0)
+    results.append(_scan_result("pymzml", times, peak_count))
+    mean, std = _stats(times)[:2]
+    print(f"    MS2 scan (filter + count): {mean:.2f} ± {std:.2f} s ({peak_count:,} peaks)")
 
-    times, ms2_count = time_operation(ms2_filter, runs=1, warmup=0)
-    results.append(TimingResult(
-        operation="ms2_filter",
-        tool="pymzml",
-        mean_seconds=statistics.mean(times),
-        std_seconds=0,
-        min_seconds=min(times),
-        max_seconds=max(times),
-        runs=1,
-        result_count=ms2_count
-    ))
-    print(f"    MS2 filter: {statistics.mean(times):.2f} s ({ms2_count:,} spectra)")
-
-    # Count MS2 peaks
-    def count_ms2_peaks():
-        total = 0
-        for spec in pymzml.run.Reader(mzml_path):
-            if spec.ms_level == 2:
-                total += len(spec.mz)
-        return total
+    return results
 
-    times, peak_count = time_operation(count_ms2_peaks, runs=1, warmup=0)
-    results.append(TimingResult(
-        operation="count_ms2_peaks",
-        tool="pymzml",
-        mean_seconds=statistics.mean(times),
-        std_seconds=0,
-        min_seconds=min(times),
-        max_seconds=max(times),
-        runs=1,
-        result_count=peak_count
-    ))
-    print(f"    Count MS2 peaks: {statistics.mean(times):.2f} s ({peak_count:,} peaks)")
 
-    return results
+def _pivot(results: List[TimingResult]) -> Dict[str, Dict[str, TimingResult]]:
+    """Group results as {operation: {tool: TimingResult}}"""
+    pivot = {}
+    for r in results:
+        pivot.setdefault(r.operation, {})[r.tool] = r
+    return pivot
 
 
-def calculate_speedups(results: List[TimingResult]) -> dict:
+def calculate_speedups(pivot: Dict[str, Dict[str, TimingResult]]) -> dict:
     """Calculate speedup ratios between tools"""
     speedups = {}
 
-    # Group by operation
-    by_operation = {}
-    for r in results:
-        if r.operation not in by_operation:
-            by_operation[r.operation] = {}
-        by_operation[r.operation][r.tool] = r.mean_seconds
-
-    for op, tools in by_operation.items():
+    for op, tools in pivot.items():
         if 'mzpeak' in tools:
-            mzpeak_time = tools['mzpeak']
+            mzpeak_time = tools['mzpeak'].mean_seconds
             speedups[op] = {}
-            for tool, time in tools.items():
+            for tool, r in tools.items():
                 if tool != 'mzpeak':
-                    speedups[op][f"vs_{tool}"] = round(time / mzpeak_time, 1) if mzpeak_time > 0 else 0
+                    speedups[op][f"vs_{tool}"] = round(r.mean_seconds / mzpeak_time, 1) if mzpeak_time > 0 else 0
 
     return speedups
 
 
-def print_comparison_table(results: List[TimingResult], speedups: dict):
+TOOLS = ("mzpeak", "pyteomics", "pymzml")
+TABLE_ROW = "{:<25} {:<15} {:<15} {:<15} {:<15}"
+LATEX_ROW = "{} & {} & {} & {} & {} \\\\"
+
+
+def _fmt(r: Optional[TimingResult], precision: int) -> str:
+    """Format a mean time as ms below one second, otherwise as seconds"""
+    if r is None:
+        return "--"
+    if r.mean_seconds < 1:
+        return f"{r.mean_seconds*1000:.1f} ms"
+    return f"{r.mean_seconds:.{precision}f} s"
+
+
+def _fmt_speedup(speedups: dict, op: str, suffix: str) -> str:
+    """Format the mzPeak speedup over pyteomics for an operation"""
+    speedup = speedups.get(op, {}).get('vs_pyteomics')
+    return "--" if speedup is None else f"{speedup:.0f}{suffix}"
+
+
+def print_comparison_table(pivot: Dict[str, Dict[str, TimingResult]], speedups: dict):
     """Print a formatted comparison table"""
     print("\n" + "="*80)
     print("COMPARISON TABLE")
     print("="*80)
 
-    # Group by operation
-    by_operation = {}
-    for r in results:
-        if r.operation not in by_operation:
-            by_operation[r.operation] = {}
-        by_operation[r.operation][r.tool] = r
-
-    operations = ["file_open_metadata", "random_spectrum_access", "ms2_filter", "count_ms2_peaks"]
+    operations = ["file_open_metadata", "metadata_access", "random_spectrum_access",
+                  "ms2_filter", "count_ms2_peaks", "ms2_scan"]
 
-    print(f"\n{'Operation':<25} {'mzPeak':<15} {'pyteomics':<15} {'pymzml':<15} {'Speedup':<15}")
+    print()
+    print(TABLE_ROW.format("Operation", "mzPeak", "pyteomics", "pymzml", "Speedup"))
     print("-"*80)
 
     for op in operations:
-        if op not in by_operation:
+        if op not in pivot:
             continue
 
-        tools = by_operation[op]
-        row = [op]
-
-        for tool in ['mzpeak', 'pyteomics', 'pymzml']:
-            if tool in tools:
-                r = tools[tool]
-                if r.mean_seconds < 1:
-                    row.append(f"{r.mean_seconds*1000:.1f} ms")
-                else:
-                    row.append(f"{r.mean_seconds:.2f} s")
-            else:
-                row.append("--")
-
-        # Speedup
-        if op in speedups and 'vs_pyteomics' in speedups[op]:
-            row.append(f"{speedups[op]['vs_pyteomics']:.0f}x")
-        else:
-            row.append("--")
-
-        print(f"{row[0]:<25} {row[1]:<15} {row[2]:<15} {row[3]:<15} {row[4]:<15}")
+        tools = pivot[op]
+        print(TABLE_ROW.format(
+            op,
+            *(_fmt(tools.get(tool), 2) for tool in TOOLS),
+            _fmt_speedup(speedups, op, "x"),
+        ))
 
+    print("-"*80)
+    print("Note: pyteomics reuses one indexed reader (use_index=True, reset() between scans);")
+    print("      mzML tools decode every spectrum while iterating, so MS2 filtering and")
+    print("      peak counting are timed together as one pass (ms2_scan).")
     print("="*80)
 
 
-def generate_latex_table(results: List[TimingResult], speedups: dict) -> str:
+def generate_latex_table(pivot: Dict[str, Dict[str, TimingResult]], speedups: dict) -> str:
     """Generate LaTeX table for manuscript"""
-    by_operation = {}
-    for r in results:
-        if r.operation not in by_operation:
-            by_operation[r.operation] = {}
-        by_operation[r.operation][r.tool] = r
-
     lines = [
         "% Parser Comparison Table",
         "\\begin{tabular}{lrrrr}",
@@ -420,35 +499,23 @@ def generate_latex_table(results: List[TimingResult], speedups: dict) -> str:
 
     op_names = {
         "file_open_metadata": "File open + metadata",
+        "metadata_access": "Metadata access (open reader)",
         "random_spectrum_access": "Random spectrum access",
         "ms2_filter": "MS2 filtering",
         "count_ms2_peaks": "Count MS2 peaks",
+        "ms2_scan": "MS2 filter + peak count (one pass)",
     }
 
     for op, name in op_names.items():
-        if op not in by_operation:
+        if op not in pivot:
             continue
 
-        tools = by_operation[op]
-        row = [name]
-
-        for tool in ['mzpeak', 'pyteomics', 'pymzml']:
-            if tool in tools:
-                r = tools[tool]
-                if r.mean_seconds < 1:
-                    row.append(f"{r.mean_seconds*1000:.1f} ms")
-                else:
-                    row.append(f"{r.mean_seconds:.1f} s")
-            else:
-                row.append("--")
-
-        # Speedup
-        if op in speedups and 'vs_pyteomics' in speedups[op]:
-            row.append(f"{speedups[op]['vs_pyteomics']:.0f}$\\times$")
-        else:
-            row.append("--")
-
-        lines.append(f"{row[0]} & {row[1]} & {row[2]} & {row[3]} & {row[4]} \\\\")
+        tools = pivot[op]
+        lines.append(LATEX_ROW.format(
+            name,
+            *(_fmt(tools.get(tool), 1) for tool in TOOLS),
+            _fmt_speedup(speedups, op, "$\\times$"),
+        ))
 
     lines.extend([
         "\\bottomrule",
@@ -468,6 +535,10 @@ def main():
                        help="Number of runs for mzPeak benchmarks")
     parser.add_argument("--output", "-o", default="comparison_results.json",
                        help="Output JSON file")
+    parser.add_argument("--legacy", action="store_true",
+                       help="Count MS2 peaks by iterating Spectrum objects")
+    parser.add_argument("--lxml-prefilter", action="store_true",
+                       help="Stream mzML with lxml and only parse MS2 spectra with pyteomics")
 
     args = parser.parse_args()
 
@@ -487,40 +558,38 @@ def main():
     print(f"\nmzML file: {mzml_path} ({mzml_path.stat().st_size / (1024**3):.2f} GB)")
     print(f"mzPeak file: {mzpeak_path}")
 
-    # Get spectrum count from mzPeak
-    try:
-        import mzpeak
-        reader = mzpeak.MzPeakReader(str(mzpeak_path))
-        num_spectra = reader.summary().num_spectra
-        print(f"Spectra: {num_spectra:,}")
-    except ImportError:
+    all_results = []
+
+    # mzPeak goes first: its cold open must not follow another read of the
+    # file, and it supplies the spectrum count for the mzML tools
+    mzpeak_results = benchmark_mzpeak(str(mzpeak_path), runs=args.runs, legacy=args.legacy)
+    all_results.extend(mzpeak_results)
+    if mzpeak_results:
+        num_spectra = mzpeak_results[0].result_count
+        print(f"\nSpectra: {num_spectra:,}")
+    else:
         num_spectra = 10000  # Estimate
         print("Note: Could not determine spectrum count (mzpeak bindings not available)")
 
-    all_results = []
-
-    # Benchmark each tool
-    all_results.extend(benchmark_mzpeak(str(mzpeak_path), num_spectra, runs=args.runs))
-    all_results.extend(benchmark_pyteomics(str(mzml_path), num_spectra))
+    # Benchmark the mzML tools
+    all_results.extend(benchmark_pyteomics(str(mzml_path), num_spectra,
+                                           lxml_prefilter=args.lxml_prefilter))
     all_results.extend(benchmark_pymzml(str(mzml_path), num_spectra))
 
     # Calculate speedups
-    speedups = calculate_speedups(all_results)
+    pivot = _pivot(all_results)
+    speedups = calculate_speedups(pivot)
 
     # Print comparison table
-    print_comparison_table(all_results, speedups)
+    print_comparison_table(pivot, speedups)
 
     # Save results
     output_path = Path(args.output)
-    with open(output_path, 'w') as f:
-        json.dump({
-            "results": [asdict(r) for r in all_results],
-            "speedups": speedups
-        }, f, indent=2)
+    save_json(output_path, {"results": all_results, "speedups": speedups})
     print(f"\nResults saved to: {output_path}")
 
     # Generate LaTeX table
-    latex_table = generate_latex_table(all_results, speedups)
+    latex_table = generate_latex_table(pivot, speedups)
     latex_path = output_path.with_suffix('.tex')
     with open(latex_path, 'w') as f:
         f.write(latex_table)
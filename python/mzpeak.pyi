@@ -97,7 +97,22 @@ class Spectrum:
     
     @property
     def peaks(self) -> List[Peak]:
-        """List of peaks in this spectrum."""
+        """
+        List of peaks in this spectrum.
+        
+        Allocates one Peak object per peak. Prefer `mz`, `intensity` and
+        `num_peaks` for anything beyond inspecting a few peaks.
+        """
+        ...
+    
+    @property
+    def mz(self) -> Any:
+        """m/z values of all peaks (NumPy float64 array)."""
+        ...
+    
+    @property
+    def intensity(self) -> Any:
+        """Intensities of all peaks (NumPy float32 array)."""
         ...
     
     @property
@@ -218,13 +233,29 @@ class SpectrumArrays:
     def polarity(self) -> int: ...
 
     @property
-    def mz_array(self) -> Any: ...
+    def mz_array(self) -> Any:
+        """
+        m/z array (NumPy).
+
+        Read-only for spectra returned by a reader, which borrow the decoded
+        Arrow buffers; copy with numpy.array(...) before modifying in place.
+        Arrays of a SpectrumArrays built in Python are returned as passed.
+        """
+        ...
 
     @property
-    def intensity_array(self) -> Any: ...
+    def intensity_array(self) -> Any:
+        """Intensity array (NumPy); read-only for spectra returned by a reader."""
+        ...
 
     @property
-    def ion_mobility_array(self) -> Any: ...
+    def ion_mobility_array(self) -> Any:
+        """
+        Ion mobility values, a (values, validity) tuple, or None.
+
+        Read-only for spectra returned by a reader, like mz_array.
+        """
+        ...
 
     @property
     def num_peaks(self) -> int: ...
@@ -401,6 +432,16 @@ class Chromatogram:
         """Intensity values."""
         ...
     
+    @property
+    def time(self) -> Any:
+        """Time values in seconds (NumPy float64 array)."""
+        ...
+    
+    @property
+    def intensity(self) -> Any:
+        """Intensity values (NumPy float32 array)."""
+        ...
+    
     def __len__(self) -> int: ...
 
 class Mobilogram:
@@ -434,6 +475,16 @@ class Mobilogram:
         """Intensity values."""
         ...
     
+    @property
+    def mobility(self) -> Any:
+        """Ion mobility values (NumPy float64 array)."""
+        ...
+    
+    @property
+    def intensity(self) -> Any:
+        """Intensity values (NumPy float32 array)."""
+        ...
+    
     def __len__(self) -> int: ...
 
 # Configuration classes
@@ -445,7 +496,8 @@ class WriterConfig:
         compression: str = "zstd",
         compression_level: int = 9,
         row_group_size: int = 100000,
-        data_page_size: int = 1048576
+        data_page_size: int = 1048576,
+        metadata_compression: Optional[str] = "none"
     ) -> None:
         """
         Create a new writer configuration.
@@ -455,6 +507,9 @@ class WriterConfig:
             compression_level: ZSTD compression level (1-22, default 9)
             row_group_size: Number of rows per row group (default 100000)
             data_page_size: Data page size in bytes (default 1MB)
+            metadata_compression: Compression for the ms_level, polarity and
+                precursor_charge columns (default "none"; None uses
+                compression)
         """
         ...
     
@@ -612,6 +667,12 @@ class SpectrumArraysViewIterator:
     def __next__(self) -> SpectrumArraysView: ...
     def __len__(self) -> int: ...
 
+class SpectrumArraysViewChunkIterator:
+    """Iterator over lists of spectra (SoA view arrays)."""
+
+    def __iter__(self) -> SpectrumArraysViewChunkIterator: ...
+    def __next__(self) -> List[SpectrumArraysView]: ...
+
 class MzPeakReader:
     """
     Reader for mzPeak format files.
@@ -629,7 +690,9 @@ class MzPeakReader:
     def __init__(
         self,
         path: Union[str, PathLike],
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        mmap: bool = False,
+        lazy: bool = True
     ) -> None:
         """
         Open an mzPeak file for reading.
@@ -637,16 +700,44 @@ class MzPeakReader:
         Args:
             path: Path to the mzPeak file, directory, or ZIP container
             batch_size: Optional batch size for reading (default: 65536)
+            mmap: Memory-map single Parquet files instead of reading them
+                through buffered file I/O (default: False). The file must
+                not be modified while the reader is open. Requires a build
+                with the `mmap` feature, which the published wheels enable.
+            lazy: Decode the peak table on every full read (default: True).
+                With lazy=False the first full read (to_arrow,
+                all_spectra_arrays, iteration) is cached and reused until
+                drop_cache() or close().
+
+        Raises:
+            ValueError: If mmap=True and mzpeak was built without the
+                `mmap` feature
         """
         ...
     
     @staticmethod
     def open(
         path: Union[str, PathLike],
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        mmap: bool = False,
+        lazy: bool = True
     ) -> MzPeakReader:
         """Open an mzPeak file (alternative constructor)."""
         ...
+
+    @staticmethod
+    def from_bytes(
+        data: bytes,
+        batch_size: Optional[int] = None,
+        lazy: bool = True
+    ) -> MzPeakReader:
+        """
+        Read an mzPeak Parquet file that is already in memory.
+        
+        The bytes object is shared with the reader rather than copied.
+        Chromatograms and mobilograms are not available from a single buffer.
+        """
+        ...
     
     def metadata(self) -> FileMetadata:
         """Get file metadata."""
@@ -660,6 +751,21 @@ class MzPeakReader:
         """Get total number of peaks in the file."""
         ...
     
+    def peak_count_by_ms_level(self, ms_level: int) -> int:
+        """
+        Count peaks belonging to spectra of a given MS level.
+        
+        Reads only the ms_level column (or row-group statistics) without
+        constructing Spectrum objects.
+        
+        Args:
+            ms_level: MS level to count (e.g. 2 for MS2)
+            
+        Returns:
+            Number of peaks in spectra of that MS level
+        """
+        ...
+    
     def get_spectrum(self, spectrum_id: int) -> Optional[Spectrum]:
         """
         Get a single spectrum by ID.
@@ -710,7 +816,12 @@ class MzPeakReader:
         ...
 
     def all_spectra_arrays(self) -> List[SpectrumArrays]:
-        """Get all spectra from the file as SoA arrays."""
+        """
+        Get all spectra from the file as SoA arrays.
+        
+        Arrays borrow the decoded record batches; only spectra that straddle
+        a batch boundary are copied.
+        """
         ...
 
     def all_spectra_arrays_views(self) -> List[SpectrumArraysView]:
@@ -771,6 +882,17 @@ class MzPeakReader:
     def iter_spectra_arrays_views(self) -> SpectrumArraysViewIterator:
         """Return an iterator over all spectra as SoA array views."""
         ...
+
+    def iter_spectra_arrays_view_chunks(
+        self, chunk_size: int = 1024
+    ) -> SpectrumArraysViewChunkIterator:
+        """
+        Return an iterator yielding lists of up to chunk_size SoA array views.
+        
+        Each step decodes a whole chunk in one call, so a Python loop crosses
+        into Rust once per chunk instead of once per spectrum.
+        """
+        ...
     
     def to_arrow(self) -> "pyarrow.Table":
         """
@@ -787,17 +909,33 @@ class MzPeakReader:
         """
         ...
     
-    def to_pandas(self) -> "pandas.DataFrame":
+    def __arrow_c_stream__(self, requested_schema: Optional[object] = None) -> object:
+        """
+        Arrow PyCapsule stream protocol.
+        
+        Lets Arrow consumers such as pyarrow.table(reader), Polars or DuckDB
+        import the peak table directly through the Arrow C Data Interface.
+        """
+        ...
+    
+    def to_pandas(self, zero_copy_only: bool = False) -> "pandas.DataFrame":
         """
         Export data as a pandas DataFrame.
         
-        Internally uses zero-copy Arrow handoff for efficiency.
+        Internally uses zero-copy Arrow handoff for efficiency. The intermediate
+        Arrow table is converted with `split_blocks=True, self_destruct=True`,
+        so its buffers are released column by column during conversion.
+        
+        Args:
+            zero_copy_only: Raise instead of copying when a column cannot be
+                converted without a copy (e.g. columns containing nulls)
         
         Returns:
             pandas.DataFrame containing all peak data
             
         Raises:
             ImportError: If pandas or pyarrow is not installed
+            pyarrow.ArrowInvalid: If zero_copy_only is set and a copy is required
         """
         ...
     
@@ -823,6 +961,10 @@ class MzPeakReader:
         """Check if the reader is open."""
         ...
     
+    def drop_cache(self) -> None:
+        """Release peak batches cached by a reader opened with lazy=False."""
+        ...
+    
     def __enter__(self) -> MzPeakReader: ...
     def __exit__(
         self,
@@ -853,7 +995,8 @@ class MzPeakWriter:
     def __init__(
         self,
         path: Union[str, PathLike],
-        config: Optional[WriterConfig] = None
+        config: Optional[WriterConfig] = None,
+        row_group_size: Optional[int] = None
     ) -> None:
         """
         Create a new mzPeak writer.
@@ -861,35 +1004,39 @@ class MzPeakWriter:
         Args:
             path: Output file path
             config: Optional WriterConfig for compression and batching settings
+            row_group_size: Peaks per row group; overrides config.row_group_size.
+                Writes are buffered until this many peaks are pending.
         """
         ...
     
     def write_spectrum(self, spectrum: Spectrum) -> None:
-        """Write a single spectrum."""
-        ...
-
-    def write_spectrum_arrays(self, spectrum: SpectrumArrays) -> None:
-        """Write a single spectrum using SoA arrays."""
+        """
+        Write a single spectrum.
+        
+        Spectra are buffered and written together once a row group's worth
+        of peaks accumulates, or when the writer is closed.
+        """
         ...
 
     def write_spectrum_arrays(self, spectrum: SpectrumArrays) -> None:
-        """Write a single spectrum using SoA arrays."""
+        """
+        Write a single spectrum using SoA arrays.
+        
+        Spectra are buffered and written together as one record batch once
+        a row group's worth of peaks accumulates, or when the writer is closed.
+        """
         ...
     
     def write_spectra(self, spectra: List[Spectrum]) -> None:
-        """Write multiple spectra in a batch."""
+        """Write multiple spectra in a batch (buffered like write_spectrum)."""
         ...
 
     def write_spectra_arrays(self, spectra: List[SpectrumArrays]) -> None:
-        """Write multiple spectra using SoA arrays."""
-        ...
-
-    def write_spectra_arrays(self, spectra: List[SpectrumArrays]) -> None:
-        """Write multiple spectra using SoA arrays."""
+        """Write multiple spectra using SoA arrays (buffered like write_spectrum_arrays)."""
         ...
     
     def stats(self) -> WriterStats:
-        """Get current writer statistics."""
+        """Get current writer statistics (flushes buffered spectra first)."""
         ...
     
     def close(self) -> WriterStats:
@@ -1083,6 +1230,22 @@ class SpectrumBuilder:
         """Add a single peak."""
         ...
     
+    def add_peaks(
+        self,
+        mz: Any,
+        intensity: Any
+    ) -> SpectrumBuilder:
+        """
+        Add many peaks from NumPy arrays in one call.
+        
+        Equivalent to calling add_peak for each pair, without crossing the
+        Python/Rust boundary per peak.
+        
+        Raises:
+            ValueError: If the arrays differ in length or are not contiguous
+        """
+        ...
+    
     def add_peak_with_im(
         self,
         mz: float,
@@ -0,0 +1,56 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+import mzpeak
+
+
+def _spectrum(spectrum_id, num_peaks):
+    mz = np.linspace(100.0, 1000.0, num_peaks)
+    intensity = np.arange(1, num_peaks + 1, dtype=np.float32)
+    return mzpeak.SpectrumArrays(spectrum_id, spectrum_id + 1, 1, float(spectrum_id), 1,
+                                 mz, intensity)
+
+
+class SpectrumArraysWriteableTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "test.parquet"
+        with mzpeak.MzPeakWriter(str(self.path)) as writer:
+            writer.write_spectra_arrays([_spectrum(0, 3), _spectrum(1, 4)])
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_built_in_python_is_writeable(self):
+        spectrum = _spectrum(0, 3)
+        self.assertTrue(spectrum.mz_array.flags.writeable)
+        self.assertTrue(spectrum.intensity_array.flags.writeable)
+
+    def test_from_reader_is_readonly(self):
+        with mzpeak.MzPeakReader(str(self.path)) as reader:
+            spectra = reader.all_spectra_arrays()
+        self.assertEqual([s.num_peaks for s in spectra], [3, 4])
+        for spectrum in spectra:
+            self.assertFalse(spectrum.mz_array.flags.writeable)
+            self.assertFalse(spectrum.intensity_array.flags.writeable)
+            with self.assertRaises(ValueError):
+                spectrum.mz_array[0] = 0.0
+
+        copy = np.array(spectra[0].mz_array)
+        copy *= 2
+        np.testing.assert_allclose(copy, 2 * np.linspace(100.0, 1000.0, 3))
+
+    def test_split_across_batches_is_readonly(self):
+        # batch_size=2 splits the second spectrum, which is then materialized
+        with mzpeak.MzPeakReader(str(self.path), batch_size=2) as reader:
+            spectra = reader.all_spectra_arrays()
+        for spectrum in spectra:
+            self.assertFalse(spectrum.mz_array.flags.writeable)
+            self.assertFalse(spectrum.intensity_array.flags.writeable)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+import numpy as np
+
+import mzpeak
+
+
+class SpectrumBuilderAddPeaksTest(unittest.TestCase):
+    def test_add_peaks_matches_add_peak(self):
+        mz = np.asarray([100.0, 200.0, 300.0, 400.0], dtype=np.float64)
+        intensity = np.asarray([10.0, 20.0, 30.0, 40.0], dtype=np.float32)
+
+        one_at_a_time = mzpeak.SpectrumBuilder(1, 1).ms_level(1)
+        for m, i in zip(mz, intensity):
+            one_at_a_time.add_peak(float(m), float(i))
+        expected = one_at_a_time.build()
+
+        vectorized = (
+            mzpeak.SpectrumBuilder(1, 1)
+            .ms_level(1)
+            .add_peak(float(mz[0]), float(intensity[0]))
+            .add_peaks(mz[1:], intensity[1:])
+            .build()
+        )
+
+        self.assertEqual(vectorized.num_peaks, expected.num_peaks)
+        np.testing.assert_array_equal(vectorized.mz, expected.mz)
+        np.testing.assert_array_equal(vectorized.intensity, expected.intensity)
+
+    def test_add_peaks_length_mismatch(self):
+        builder = mzpeak.SpectrumBuilder(1, 1)
+        with self.assertRaises(ValueError):
+            builder.add_peaks(np.asarray([100.0, 200.0]), np.asarray([10.0], dtype=np.float32))
+        self.assertEqual(builder.build().num_peaks, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
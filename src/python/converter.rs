@@ -3,6 +3,7 @@
 //! Provides high-level conversion API with progress reporting and GIL release.
 
 use pyo3::prelude::*;
+use std::path::PathBuf;
 
 use crate::mzml::converter::{ConversionConfig, MzMLConverter};
 use crate::python::exceptions::IntoPyResult;
@@ -59,8 +60,8 @@ impl PyMzMLConverter {
     fn convert(
         &self,
         py: Python<'_>,
-        input_path: String,
-        output_path: String,
+        input_path: PathBuf,
+        output_path: PathBuf,
     ) -> PyResult<PyConversionStats> {
         let converter = MzMLConverter::with_config(self.config.clone());
 
@@ -86,8 +87,8 @@ impl PyMzMLConverter {
     fn convert_with_sharding(
         &self,
         py: Python<'_>,
-        input_path: String,
-        output_path: String,
+        input_path: PathBuf,
+        output_path: PathBuf,
         max_peaks_per_file: usize,
     ) -> PyResult<PyConversionStats> {
         // Clone config and set max_peaks_per_file
@@ -133,8 +134,8 @@ impl PyMzMLConverter {
 #[pyo3(signature = (input_path, output_path, config=None))]
 pub fn convert(
     py: Python<'_>,
-    input_path: String,
-    output_path: String,
+    input_path: PathBuf,
+    output_path: PathBuf,
     config: Option<PyConversionConfig>,
 ) -> PyResult<PyConversionStats> {
     let conversion_config = config.map(|c| c.inner).unwrap_or_default();
@@ -167,8 +168,8 @@ pub fn convert(
 #[pyo3(signature = (input_path, output_path, max_peaks_per_file=50_000_000, config=None))]
 pub fn convert_with_sharding(
     py: Python<'_>,
-    input_path: String,
-    output_path: String,
+    input_path: PathBuf,
+    output_path: PathBuf,
     max_peaks_per_file: usize,
     config: Option<PyConversionConfig>,
 ) -> PyResult<PyConversionStats> {
@@ -67,6 +67,7 @@ fn mzpeak(py: Python<'_>, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<reader::PySpectrumIterator>()?;
     m.add_class::<reader::PyStreamingSpectrumArraysIterator>()?;
     m.add_class::<reader::PyStreamingSpectrumArraysViewIterator>()?;
+    m.add_class::<reader::PySpectrumArraysViewChunkIterator>()?;
 
     // Register writer classes
     m.add_class::<writer::PyMzPeakWriter>()?;
@@ -5,6 +5,8 @@
 use arrow::array::RecordBatch;
 use arrow::ffi_stream::FFI_ArrowArrayStream;
 use pyo3::prelude::*;
+use pyo3::types::PyBytes;
+use std::path::PathBuf;
 
 #[pyclass(name = "_ArrowCStream")]
 struct PyArrowCStream {
@@ -26,8 +28,7 @@ use crate::python::types::{
     PySpectrumArraysView,
 };
 use crate::reader::{
-    MzPeakReader, ReaderConfig, StreamingSpectrumArraysIterator, StreamingSpectrumArraysViewIterator,
-    StreamingSpectrumIterator,
+    MzPeakReader, ReaderConfig, StreamingSpectrumArraysViewIterator, StreamingSpectrumIterator,
 };
 
 /// Reader for mzPeak format files
@@ -43,7 +44,7 @@ use crate::reader::{
 #[pyclass(name = "MzPeakReader")]
 pub struct PyMzPeakReader {
     inner: Option<MzPeakReader>,
-    path: String,
+    path: PathBuf,
 }
 
 #[pymethods]
@@ -53,20 +54,43 @@ impl PyMzPeakReader {
     /// Args:
     ///     path: Path to the mzPeak file, directory, or ZIP container
     ///     batch_size: Optional batch size for reading (default: 65536)
+    ///     mmap: Memory-map single Parquet files instead of reading them
+    ///         through buffered file I/O (default: False). The file must not
+    ///         be modified while the reader is open. Requires a build with
+    ///         the `mmap` feature, which the published wheels enable.
+    ///     lazy: Decode the peak table on every full read (default: True).
+    ///         With lazy=False the first full read (to_arrow, all_spectra_arrays,
+    ///         iteration) is cached and reused until drop_cache() or close().
     ///
     /// Returns:
     ///     MzPeakReader instance
+    ///
+    /// Raises:
+    ///     ValueError: If mmap=True and the extension was built without the
+    ///         `mmap` feature
     #[new]
-    #[pyo3(signature = (path, batch_size=None))]
-    fn new(path: String, batch_size: Option<usize>) -> PyResult<Self> {
-        let config = batch_size.map(|bs| ReaderConfig { batch_size: bs });
-
-        let reader = if let Some(cfg) = config {
-            MzPeakReader::open_with_config(&path, cfg)
-        } else {
-            MzPeakReader::open(&path)
+    #[pyo3(signature = (path, batch_size=None, mmap=false, lazy=true))]
+    fn new(
+        py: Python<'_>,
+        path: PathBuf,
+        batch_size: Option<usize>,
+        mmap: bool,
+        lazy: bool,
+    ) -> PyResult<Self> {
+        let mut config = ReaderConfig::default();
+        if let Some(bs) = batch_size {
+            config.batch_size = bs;
+        }
+        if mmap && !cfg!(feature = "mmap") {
+            return Err(pyo3::exceptions::PyValueError::new_err(
+                "mmap=True requires mzpeak built with the `mmap` feature",
+            ));
         }
-        .into_py_result()?;
+        config.use_mmap = mmap;
+        config.cache_batches = !lazy;
+
+        let reader =
+            py.allow_threads(|| MzPeakReader::open_with_config(&path, config).into_py_result())?;
 
         Ok(Self {
             inner: Some(reader),
@@ -76,9 +100,52 @@ impl PyMzPeakReader {
 
     /// Open an mzPeak file (alternative constructor)
     #[staticmethod]
-    #[pyo3(signature = (path, batch_size=None))]
-    fn open(path: String, batch_size: Option<usize>) -> PyResult<Self> {
-        Self::new(path, batch_size)
+    #[pyo3(signature = (path, batch_size=None, mmap=false, lazy=true))]
+    fn open(
+        py: Python<'_>,
+        path: PathBuf,
+        batch_size: Option<usize>,
+        mmap: bool,
+        lazy: bool,
+    ) -> PyResult<Self> {
+        Self::new(py, path, batch_size, mmap, lazy)
+    }
+
+    /// Read an mzPeak Parquet file that is already in memory
+    ///
+    /// The bytes object is shared with the reader rather than copied.
+    /// Chromatograms and mobilograms are not available from a single buffer.
+    ///
+    /// Args:
+    ///     data: Contents of a single mzPeak Parquet file
+    ///     batch_size: Optional batch size for reading (default: 65536)
+    ///     lazy: Decode the peak table on every full read (default: True)
+    ///
+    /// Returns:
+    ///     MzPeakReader instance
+    #[staticmethod]
+    #[pyo3(signature = (data, batch_size=None, lazy=true))]
+    fn from_bytes(
+        py: Python<'_>,
+        data: Bound<'_, PyBytes>,
+        batch_size: Option<usize>,
+        lazy: bool,
+    ) -> PyResult<Self> {
+        let mut config = ReaderConfig::default();
+        if let Some(bs) = batch_size {
+            config.batch_size = bs;
+        }
+        config.cache_batches = !lazy;
+
+        let data = bytes::Bytes::from_owner(PyBytesOwner::new(data));
+        let reader = py.allow_threads(|| {
+            MzPeakReader::from_bytes_with_config(data, config).into_py_result()
+        })?;
+
+        Ok(Self {
+            inner: Some(reader),
+            path: PathBuf::from("<bytes>"),
+        })
     }
 
     /// Get file metadata
@@ -107,6 +174,21 @@ impl PyMzPeakReader {
         Ok(reader.total_peaks())
     }
 
+    /// Count peaks belonging to spectra of a given MS level
+    ///
+    /// Reads only the ms_level column (or row-group statistics) without
+    /// constructing Spectrum objects.
+    ///
+    /// Args:
+    ///     ms_level: MS level to count (e.g. 2 for MS2)
+    ///
+    /// Returns:
+    ///     Number of peaks in spectra of that MS level
+    fn peak_count_by_ms_level(&self, py: Python<'_>, ms_level: i16) -> PyResult<i64> {
+        let reader = self.get_reader()?;
+        py.allow_threads(|| reader.peak_count_by_ms_level(ms_level).into_py_result())
+    }
+
     /// Get a single spectrum by ID
     ///
     /// Args:
@@ -134,7 +216,9 @@ impl PyMzPeakReader {
     ) -> PyResult<Option<PySpectrumArrays>> {
         let reader = self.get_reader()?;
         let spectrum = py.allow_threads(|| reader.get_spectrum_arrays(spectrum_id).into_py_result())?;
-        Ok(spectrum.map(|s| PySpectrumArrays::from_arrays(py, s)))
+        spectrum
+            .map(|s| PySpectrumArrays::from_view(py, s))
+            .transpose()
     }
 
     /// Get a single spectrum by ID as SoA array views (zero-copy)
@@ -186,10 +270,10 @@ impl PyMzPeakReader {
         let reader = self.get_reader()?;
         let spectra =
             py.allow_threads(|| reader.get_spectra_arrays(&spectrum_ids).into_py_result())?;
-        Ok(spectra
+        spectra
             .into_iter()
-            .map(|s| PySpectrumArrays::from_arrays(py, s))
-            .collect())
+            .map(|s| PySpectrumArrays::from_view(py, s))
+            .collect()
     }
 
     /// Get multiple spectra by their IDs as SoA array views (zero-copy)
@@ -228,6 +312,9 @@ impl PyMzPeakReader {
 
     /// Get all spectra from the file as SoA arrays
     ///
+    /// Arrays borrow the decoded record batches; only spectra that straddle
+    /// a batch boundary are copied into a fresh buffer.
+    ///
     /// Warning: This loads all spectra into memory. For large files,
     /// consider using iter_spectra_arrays() instead.
     ///
@@ -236,10 +323,10 @@ impl PyMzPeakReader {
     fn all_spectra_arrays(&self, py: Python<'_>) -> PyResult<Vec<PySpectrumArrays>> {
         let reader = self.get_reader()?;
         let spectra = py.allow_threads(|| reader.iter_spectra_arrays().into_py_result())?;
-        Ok(spectra
+        spectra
             .into_iter()
-            .map(|s| PySpectrumArrays::from_arrays(py, s))
-            .collect())
+            .map(|s| PySpectrumArrays::from_view(py, s))
+            .collect()
     }
 
     /// Get all spectra from the file as SoA array views (zero-copy)
@@ -294,10 +381,10 @@ impl PyMzPeakReader {
         let reader = self.get_reader()?;
         let spectra =
             py.allow_threads(|| reader.spectra_by_rt_range_arrays(min_rt, max_rt).into_py_result())?;
-        Ok(spectra
+        spectra
             .into_iter()
-            .map(|s| PySpectrumArrays::from_arrays(py, s))
-            .collect())
+            .map(|s| PySpectrumArrays::from_view(py, s))
+            .collect()
     }
 
     /// Get spectra by MS level
@@ -328,10 +415,10 @@ impl PyMzPeakReader {
         let reader = self.get_reader()?;
         let spectra =
             py.allow_threads(|| reader.spectra_by_ms_level_arrays(ms_level).into_py_result())?;
-        Ok(spectra
+        spectra
             .into_iter()
-            .map(|s| PySpectrumArrays::from_arrays(py, s))
-            .collect())
+            .map(|s| PySpectrumArrays::from_view(py, s))
+            .collect()
     }
 
     /// Get all spectrum IDs in the file
@@ -373,9 +460,9 @@ impl PyMzPeakReader {
     ///
     /// Returns:
     ///     Iterator yielding Spectrum objects
-    fn iter_spectra(&self) -> PyResult<PyStreamingSpectrumIterator> {
+    fn iter_spectra(&self, py: Python<'_>) -> PyResult<PyStreamingSpectrumIterator> {
         let reader = self.get_reader()?;
-        let streaming_iter = reader.iter_spectra_streaming().into_py_result()?;
+        let streaming_iter = py.allow_threads(|| reader.iter_spectra_streaming().into_py_result())?;
         Ok(PyStreamingSpectrumIterator::new(streaming_iter))
     }
 
@@ -383,9 +470,9 @@ impl PyMzPeakReader {
     ///
     /// Returns:
     ///     Iterator yielding SpectrumArrays objects
-    fn iter_spectra_arrays(&self) -> PyResult<PyStreamingSpectrumArraysIterator> {
+    fn iter_spectra_arrays(&self, py: Python<'_>) -> PyResult<PyStreamingSpectrumArraysIterator> {
         let reader = self.get_reader()?;
-        let streaming_iter = reader.iter_spectra_arrays_streaming().into_py_result()?;
+        let streaming_iter = py.allow_threads(|| reader.iter_spectra_arrays_streaming().into_py_result())?;
         Ok(PyStreamingSpectrumArraysIterator::new(streaming_iter))
     }
 
@@ -393,12 +480,42 @@ impl PyMzPeakReader {
     ///
     /// Returns:
     ///     Iterator yielding SpectrumArraysView objects
-    fn iter_spectra_arrays_views(&self) -> PyResult<PyStreamingSpectrumArraysViewIterator> {
+    fn iter_spectra_arrays_views(&self, py: Python<'_>) -> PyResult<PyStreamingSpectrumArraysViewIterator> {
         let reader = self.get_reader()?;
-        let streaming_iter = reader.iter_spectra_arrays_views_streaming().into_py_result()?;
+        let streaming_iter = py.allow_threads(|| reader.iter_spectra_arrays_views_streaming().into_py_result())?;
         Ok(PyStreamingSpectrumArraysViewIterator::new(streaming_iter))
     }
 
+    /// Return a streaming iterator yielding lists of SoA array views
+    ///
+    /// Each step decodes up to `chunk_size` spectra in one call, so a Python
+    /// loop crosses into Rust once per chunk instead of once per spectrum.
+    ///
+    /// Args:
+    ///     chunk_size: Maximum number of views per list (default: 1024)
+    ///
+    /// Returns:
+    ///     Iterator yielding lists of SpectrumArraysView objects
+    #[pyo3(signature = (chunk_size=1024))]
+    fn iter_spectra_arrays_view_chunks(
+        &self,
+        py: Python<'_>,
+        chunk_size: usize,
+    ) -> PyResult<PySpectrumArraysViewChunkIterator> {
+        if chunk_size == 0 {
+            return Err(pyo3::exceptions::PyValueError::new_err(
+                "chunk_size must be positive",
+            ));
+        }
+        let reader = self.get_reader()?;
+        let streaming_iter =
+            py.allow_threads(|| reader.iter_spectra_arrays_views_streaming().into_py_result())?;
+        Ok(PySpectrumArraysViewChunkIterator {
+            inner: Some(streaming_iter),
+            chunk_size,
+        })
+    }
+
     /// Export data as a streaming PyArrow RecordBatchReader (Issue 005 fix)
     ///
     /// Returns a streaming reader that pulls batches on-demand from the underlying
@@ -414,7 +531,7 @@ impl PyMzPeakReader {
     ///     ImportError: If pyarrow is not installed
     fn to_arrow_stream(&self, py: Python<'_>) -> PyResult<PyObject> {
         let reader = self.get_reader()?;
-        let batch_iter = reader.iter_batches().into_py_result()?;
+        let batch_iter = py.allow_threads(|| reader.iter_batches().into_py_result())?;
         let schema = reader.schema();
 
         // Wrap in our streaming reader
@@ -434,29 +551,53 @@ impl PyMzPeakReader {
     /// For large files, prefer `to_arrow_stream()` which doesn't materialize
     /// all batches into memory at once.
     ///
+    /// Row groups are decoded in parallel with the GIL released, then handed
+    /// to PyArrow through the same C stream interface as `to_arrow_stream()`.
+    ///
     /// Returns:
     ///     pyarrow.Table containing all peak data
     ///
     /// Raises:
     ///     ImportError: If pyarrow is not installed
     fn to_arrow(&self, py: Python<'_>) -> PyResult<PyObject> {
-        // Use streaming reader, then read all into table
-        let stream_reader = self.to_arrow_stream(py)?;
-        stream_reader.call_method0(py, "read_all")
+        let reader = self.get_reader()?;
+        let batches = py.allow_threads(|| reader.read_all_batches().into_py_result())?;
+        let batch_iter = crate::reader::RecordBatchIterator::new(batches.into_iter().map(Ok));
+
+        let streaming_reader = PyStreamingArrowReader::new(batch_iter, reader.schema());
+        let py_reader = Py::new(py, streaming_reader)?;
+
+        let pa = py.import("pyarrow")?;
+        let pa_reader = pa
+            .getattr("RecordBatchReader")?
+            .call_method1("from_stream", (py_reader,))?;
+        pa_reader.call_method0("read_all").map(Into::into)
     }
 
     /// Export data as a pandas DataFrame
     ///
-    /// Internally uses zero-copy Arrow handoff for efficiency.
+    /// Internally uses zero-copy Arrow handoff for efficiency. The intermediate
+    /// Arrow table is converted with `split_blocks=True, self_destruct=True`,
+    /// so its buffers are released column by column during conversion.
+    ///
+    /// Args:
+    ///     zero_copy_only: Raise instead of copying when a column cannot be
+    ///         converted without a copy (e.g. columns containing nulls)
     ///
     /// Returns:
     ///     pandas.DataFrame containing all peak data
     ///
     /// Raises:
     ///     ImportError: If pandas or pyarrow is not installed
-    fn to_pandas(&self, py: Python<'_>) -> PyResult<PyObject> {
+    ///     pyarrow.ArrowInvalid: If zero_copy_only is set and a copy is required
+    #[pyo3(signature = (zero_copy_only=false))]
+    fn to_pandas(&self, py: Python<'_>, zero_copy_only: bool) -> PyResult<PyObject> {
         let table = self.to_arrow(py)?;
-        table.call_method0(py, "to_pandas")
+        let kwargs = pyo3::types::PyDict::new(py);
+        kwargs.set_item("zero_copy_only", zero_copy_only)?;
+        kwargs.set_item("split_blocks", true)?;
+        kwargs.set_item("self_destruct", true)?;
+        table.call_method(py, "to_pandas", (), Some(&kwargs))
     }
 
     /// Export data as a polars DataFrame
@@ -474,6 +615,24 @@ impl PyMzPeakReader {
         polars.call_method1("from_arrow", (table,)).map(|df| df.into())
     }
 
+    /// Arrow PyCapsule stream protocol
+    ///
+    /// Lets Arrow consumers such as `pyarrow.table(reader)`, Polars or DuckDB
+    /// import the peak table straight through the Arrow C Data Interface,
+    /// without a pyarrow.RecordBatchReader being built first. Batches are
+    /// decoded on demand as the consumer pulls them.
+    #[pyo3(signature = (requested_schema=None))]
+    fn __arrow_c_stream__(
+        &self,
+        py: Python<'_>,
+        requested_schema: Option<PyObject>,
+    ) -> PyResult<PyObject> {
+        let reader = self.get_reader()?;
+        let batch_iter = py.allow_threads(|| reader.iter_batches().into_py_result())?;
+        let mut stream = PyStreamingArrowReader::new(batch_iter, reader.schema());
+        stream.__arrow_c_stream__(py, requested_schema)
+    }
+
     /// Context manager entry
     fn __enter__(slf: Py<Self>) -> Py<Self> {
         slf
@@ -483,17 +642,31 @@ impl PyMzPeakReader {
     #[pyo3(signature = (_exc_type=None, _exc_val=None, _exc_tb=None))]
     fn __exit__(
         &mut self,
+        py: Python<'_>,
         _exc_type: Option<&Bound<'_, pyo3::types::PyType>>,
         _exc_val: Option<&Bound<'_, pyo3::types::PyAny>>,
         _exc_tb: Option<&Bound<'_, pyo3::types::PyAny>>,
     ) -> PyResult<bool> {
-        self.close()?;
+        self.close(py)?;
         Ok(false) // Don't suppress exceptions
     }
 
+    /// Release peak batches cached by a reader opened with lazy=False
+    fn drop_cache(&mut self, py: Python<'_>) -> PyResult<()> {
+        let reader = self.inner.as_mut().ok_or_else(|| {
+            pyo3::exceptions::PyRuntimeError::new_err("Reader is closed")
+        })?;
+        py.allow_threads(|| reader.drop_cache());
+        Ok(())
+    }
+
     /// Close the reader and release resources
-    fn close(&mut self) -> PyResult<()> {
-        self.inner = None;
+    ///
+    /// Dropping the file handle, memory map, and any cached batches happens
+    /// with the GIL released.
+    fn close(&mut self, py: Python<'_>) -> PyResult<()> {
+        let reader = self.inner.take();
+        py.allow_threads(move || drop(reader));
         Ok(())
     }
 
@@ -504,9 +677,9 @@ impl PyMzPeakReader {
 
     fn __repr__(&self) -> String {
         if self.inner.is_some() {
-            format!("MzPeakReader('{}', open=True)", self.path)
+            format!("MzPeakReader('{}', open=True)", self.path.display())
         } else {
-            format!("MzPeakReader('{}', open=False)", self.path)
+            format!("MzPeakReader('{}', open=False)", self.path.display())
         }
     }
 }
@@ -519,6 +692,37 @@ impl PyMzPeakReader {
     }
 }
 
+/// Keeps a Python `bytes` object alive while Rust borrows its buffer
+struct PyBytesOwner {
+    _object: Py<PyBytes>,
+    ptr: *const u8,
+    len: usize,
+}
+
+impl PyBytesOwner {
+    fn new(object: Bound<'_, PyBytes>) -> Self {
+        let data = object.as_bytes();
+        Self {
+            ptr: data.as_ptr(),
+            len: data.len(),
+            _object: object.unbind(),
+        }
+    }
+}
+
+// SAFETY: `bytes` objects are immutable and their buffer stays put for as
+// long as `_object` holds a reference, so the slice can be read from any
+// thread without the GIL.
+unsafe impl Send for PyBytesOwner {}
+unsafe impl Sync for PyBytesOwner {}
+
+impl AsRef<[u8]> for PyBytesOwner {
+    fn as_ref(&self) -> &[u8] {
+        // SAFETY: see the Send/Sync impls above
+        unsafe { std::slice::from_raw_parts(self.ptr, self.len) }
+    }
+}
+
 /// Convert an Arrow RecordBatch to a PyArrow RecordBatch using the C Data Interface.
 ///
 /// # Memory Safety
@@ -688,11 +892,11 @@ impl PyStreamingSpectrumIterator {
 /// Streaming iterator over spectra with SoA arrays
 #[pyclass(name = "SpectrumArraysIterator", unsendable)]
 pub struct PyStreamingSpectrumArraysIterator {
-    inner: Option<StreamingSpectrumArraysIterator>,
+    inner: Option<StreamingSpectrumArraysViewIterator>,
 }
 
 impl PyStreamingSpectrumArraysIterator {
-    pub fn new(inner: StreamingSpectrumArraysIterator) -> Self {
+    pub fn new(inner: StreamingSpectrumArraysViewIterator) -> Self {
         Self { inner: Some(inner) }
     }
 }
@@ -709,6 +913,13 @@ impl PyStreamingSpectrumArraysViewIterator {
     }
 }
 
+/// Streaming iterator over lists of SoA array views
+#[pyclass(name = "SpectrumArraysViewChunkIterator", unsendable)]
+pub struct PySpectrumArraysViewChunkIterator {
+    inner: Option<StreamingSpectrumArraysViewIterator>,
+    chunk_size: usize,
+}
+
 #[pymethods]
 impl PyStreamingSpectrumArraysIterator {
     fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
@@ -724,7 +935,7 @@ impl PyStreamingSpectrumArraysIterator {
         let result = py.allow_threads(|| inner.next());
 
         match result {
-            Some(Ok(spectrum)) => Ok(Some(PySpectrumArrays::from_arrays(py, spectrum))),
+            Some(Ok(spectrum)) => PySpectrumArrays::from_view(py, spectrum).map(Some),
             Some(Err(e)) => Err(pyo3::exceptions::PyRuntimeError::new_err(format!(
                 "Error reading spectrum arrays: {}",
                 e
@@ -765,6 +976,47 @@ impl PyStreamingSpectrumArraysViewIterator {
     }
 }
 
+#[pymethods]
+impl PySpectrumArraysViewChunkIterator {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(&mut self, py: Python<'_>) -> PyResult<Option<Vec<PySpectrumArraysView>>> {
+        let Some(inner) = self.inner.as_mut() else {
+            return Ok(None);
+        };
+        let chunk_size = self.chunk_size;
+
+        // Stop at the first error rather than decoding the rest of the chunk
+        let (views, exhausted) = py.allow_threads(|| {
+            let mut views = Vec::with_capacity(chunk_size);
+            while views.len() < chunk_size {
+                match inner.next() {
+                    Some(Ok(view)) => views.push(view),
+                    Some(Err(e)) => return (Err(e), true),
+                    None => return (Ok(views), true),
+                }
+            }
+            (Ok(views), false)
+        });
+        if exhausted {
+            self.inner = None;
+        }
+
+        let views = views.map_err(|e| {
+            pyo3::exceptions::PyRuntimeError::new_err(format!(
+                "Error reading spectrum arrays view: {}",
+                e
+            ))
+        })?;
+        if views.is_empty() {
+            return Ok(None);
+        }
+        Ok(Some(views.into_iter().map(PySpectrumArraysView::from_view).collect()))
+    }
+}
+
 #[pymethods]
 impl PyStreamingSpectrumIterator {
     fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
@@ -1,3 +1,4 @@
+use numpy::IntoPyArray;
 use pyo3::prelude::*;
 
 use crate::chromatogram_writer::Chromatogram;
@@ -53,6 +54,25 @@ impl PyChromatogram {
         self.inner.intensity_array.clone()
     }
 
+    /// Time values in seconds (NumPy float64 array)
+    ///
+    /// Prefer this over `time_array` for large traces: it builds one array
+    /// instead of a list of Python floats.
+    #[getter]
+    fn time(&self, py: Python<'_>) -> PyObject {
+        self.inner.time_array.clone().into_pyarray(py).to_object(py)
+    }
+
+    /// Intensity values (NumPy float32 array)
+    #[getter]
+    fn intensity(&self, py: Python<'_>) -> PyObject {
+        self.inner
+            .intensity_array
+            .clone()
+            .into_pyarray(py)
+            .to_object(py)
+    }
+
     fn __repr__(&self) -> String {
         format!(
             "Chromatogram(id='{}', type='{}', {} points)",
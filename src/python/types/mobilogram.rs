@@ -1,3 +1,4 @@
+use numpy::IntoPyArray;
 use pyo3::prelude::*;
 
 use crate::mobilogram_writer::Mobilogram;
@@ -53,6 +54,29 @@ impl PyMobilogram {
         self.inner.intensity_array.clone()
     }
 
+    /// Ion mobility values (NumPy float64 array)
+    ///
+    /// Prefer this over `mobility_array` for large traces: it builds one array
+    /// instead of a list of Python floats.
+    #[getter]
+    fn mobility(&self, py: Python<'_>) -> PyObject {
+        self.inner
+            .mobility_array
+            .clone()
+            .into_pyarray(py)
+            .to_object(py)
+    }
+
+    /// Intensity values (NumPy float32 array)
+    #[getter]
+    fn intensity(&self, py: Python<'_>) -> PyObject {
+        self.inner
+            .intensity_array
+            .clone()
+            .into_pyarray(py)
+            .to_object(py)
+    }
+
     fn __repr__(&self) -> String {
         format!(
             "Mobilogram(id='{}', type='{}', {} points)",
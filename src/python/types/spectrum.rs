@@ -1,3 +1,4 @@
+use numpy::IntoPyArray;
 use pyo3::prelude::*;
 
 use crate::writer::Spectrum;
@@ -82,11 +83,28 @@ impl PySpectrum {
     }
 
     /// List of peaks in this spectrum
+    ///
+    /// Allocates one Peak object per peak. Prefer `mz`, `intensity` and
+    /// `num_peaks` for anything beyond inspecting a few peaks.
     #[getter]
     fn peaks(&self) -> Vec<PyPeak> {
         self.inner.peaks.iter().cloned().map(PyPeak::from).collect()
     }
 
+    /// m/z values of all peaks (NumPy float64 array)
+    #[getter]
+    fn mz(&self, py: Python<'_>) -> PyObject {
+        let mz: Vec<f64> = self.inner.peaks.iter().map(|p| p.mz).collect();
+        mz.into_pyarray(py).to_object(py)
+    }
+
+    /// Intensities of all peaks (NumPy float32 array)
+    #[getter]
+    fn intensity(&self, py: Python<'_>) -> PyObject {
+        let intensity: Vec<f32> = self.inner.peaks.iter().map(|p| p.intensity).collect();
+        intensity.into_pyarray(py).to_object(py)
+    }
+
     /// Number of peaks in this spectrum
     #[getter]
     fn num_peaks(&self) -> usize {
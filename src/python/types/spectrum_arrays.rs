@@ -1,12 +1,29 @@
+use arrow::array::Array;
+use arrow::buffer::NullBuffer;
 use numpy::{IntoPyArray, PyReadonlyArray1};
 use pyo3::prelude::*;
 use pyo3::exceptions::PyValueError;
 
+use crate::python::exceptions::IntoPyResult;
+use crate::reader::SpectrumArraysView;
 use crate::writer::{OptionalColumnBuf, SpectrumArrays};
 
-struct IonMobilityArrays {
-    values: PyObject,
-    validity: Option<PyObject>,
+use super::spectrum_arrays_view::{numpy_view_from_f32, numpy_view_from_f64};
+
+/// Which optional peak arrays a spectrum carries
+///
+/// Decided once when the object is built, so conversion to and from
+/// `PeakArrays` is a single match rather than nested `Option` checks.
+enum PeakShape {
+    /// m/z and intensity only
+    MzIntensity,
+    /// Ion mobility present for every peak
+    MzIntensityIm { ion_mobility: PyObject },
+    /// Ion mobility with a per-peak validity mask
+    MzIntensityImValidity {
+        ion_mobility: PyObject,
+        validity: PyObject,
+    },
 }
 
 /// A mass spectrum with SoA peak arrays and metadata
@@ -33,7 +50,7 @@ pub struct PySpectrumArrays {
     num_peaks: usize,
     mz: PyObject,
     intensity: PyObject,
-    ion_mobility: Option<IonMobilityArrays>,
+    shape: PeakShape,
 }
 
 impl PySpectrumArrays {
@@ -48,32 +65,23 @@ impl PySpectrumArrays {
             )));
         }
 
-        let ion_mobility = match &self.ion_mobility {
-            None => OptionalColumnBuf::all_null(mz.len()),
-            Some(arrays) => {
-                let values = extract_vec::<f64>(py, &arrays.values, "ion_mobility")?;
-                if values.len() != mz.len() {
-                    return Err(PyValueError::new_err(format!(
-                        "ion_mobility length {} does not match mz length {}",
-                        values.len(),
-                        mz.len()
-                    )));
-                }
-                match &arrays.validity {
-                    None => OptionalColumnBuf::AllPresent(values),
-                    Some(validity_obj) => {
-                        let validity = extract_vec::<bool>(py, validity_obj, "ion_mobility_validity")?;
-                        if validity.len() != mz.len() {
-                            return Err(PyValueError::new_err(format!(
-                                "ion_mobility_validity length {} does not match mz length {}",
-                                validity.len(),
-                                mz.len()
-                            )));
-                        }
-                        OptionalColumnBuf::WithValidity { values, validity }
-                    }
-                }
-            }
+        let ion_mobility = match &self.shape {
+            PeakShape::MzIntensity => OptionalColumnBuf::all_null(mz.len()),
+            PeakShape::MzIntensityIm { ion_mobility } => OptionalColumnBuf::AllPresent(
+                extract_vec_of_len::<f64>(py, ion_mobility, "ion_mobility", mz.len())?,
+            ),
+            PeakShape::MzIntensityImValidity {
+                ion_mobility,
+                validity,
+            } => OptionalColumnBuf::WithValidity {
+                values: extract_vec_of_len::<f64>(py, ion_mobility, "ion_mobility", mz.len())?,
+                validity: extract_vec_of_len::<bool>(
+                    py,
+                    validity,
+                    "ion_mobility_validity",
+                    mz.len(),
+                )?,
+            },
         };
 
         Ok(SpectrumArrays {
@@ -103,6 +111,87 @@ impl PySpectrumArrays {
         })
     }
 
+    /// Build from a reader view without copying peak data
+    ///
+    /// When the spectrum lies within a single record batch (the common case)
+    /// the NumPy arrays borrow the Arrow buffers directly, kept alive by a
+    /// capsule. Spectra split across batches are materialized instead, and
+    /// marked read-only so every spectrum from a reader behaves the same.
+    pub(crate) fn from_view(py: Python<'_>, view: SpectrumArraysView) -> PyResult<Self> {
+        let mz_arrays = view.mz_arrays().into_py_result()?;
+        if mz_arrays.len() != 1 {
+            let spectrum = Self::from_arrays(py, view.to_owned().into_py_result()?);
+            spectrum.mark_readonly(py)?;
+            return Ok(spectrum);
+        }
+        let intensity_arrays = view.intensity_arrays().into_py_result()?;
+
+        let mz = numpy_view_from_f64(py, &mz_arrays[0])?;
+        let intensity = numpy_view_from_f32(py, &intensity_arrays[0])?;
+        let shape = match view.ion_mobility_arrays().into_py_result()? {
+            Some(arrays) if arrays[0].null_count() < arrays[0].len() => {
+                let array = &arrays[0];
+                let ion_mobility = numpy_view_from_f64(py, array)?;
+                // The validity bitmap is bit-packed, so it is the only part
+                // that has to be expanded into a new (bool) array
+                match array.nulls().filter(|nulls| nulls.null_count() > 0) {
+                    None => PeakShape::MzIntensityIm { ion_mobility },
+                    Some(nulls) => {
+                        let validity = unpack_validity(nulls).into_pyarray(py).to_object(py);
+                        set_readonly(py, &validity)?;
+                        PeakShape::MzIntensityImValidity {
+                            ion_mobility,
+                            validity,
+                        }
+                    }
+                }
+            }
+            _ => PeakShape::MzIntensity,
+        };
+
+        Ok(Self {
+            spectrum_id: view.spectrum_id,
+            scan_number: view.scan_number,
+            ms_level: view.ms_level,
+            retention_time: view.retention_time,
+            polarity: view.polarity,
+            precursor_mz: view.precursor_mz,
+            precursor_charge: view.precursor_charge,
+            precursor_intensity: view.precursor_intensity,
+            isolation_window_lower: view.isolation_window_lower,
+            isolation_window_upper: view.isolation_window_upper,
+            collision_energy: view.collision_energy,
+            total_ion_current: view.total_ion_current,
+            base_peak_mz: view.base_peak_mz,
+            base_peak_intensity: view.base_peak_intensity,
+            injection_time: view.injection_time,
+            pixel_x: view.pixel_x,
+            pixel_y: view.pixel_y,
+            pixel_z: view.pixel_z,
+            num_peaks: view.peak_count(),
+            mz,
+            intensity,
+            shape,
+        })
+    }
+
+    /// Clear the writeable flag on every peak array
+    fn mark_readonly(&self, py: Python<'_>) -> PyResult<()> {
+        set_readonly(py, &self.mz)?;
+        set_readonly(py, &self.intensity)?;
+        match &self.shape {
+            PeakShape::MzIntensity => Ok(()),
+            PeakShape::MzIntensityIm { ion_mobility } => set_readonly(py, ion_mobility),
+            PeakShape::MzIntensityImValidity {
+                ion_mobility,
+                validity,
+            } => {
+                set_readonly(py, ion_mobility)?;
+                set_readonly(py, validity)
+            }
+        }
+    }
+
     pub(crate) fn from_arrays(py: Python<'_>, spectrum: SpectrumArrays) -> Self {
         let SpectrumArrays {
             spectrum_id,
@@ -129,16 +218,17 @@ impl PySpectrumArrays {
         let num_peaks = peaks.mz.len();
         let mz = peaks.mz.into_pyarray(py).to_object(py);
         let intensity = peaks.intensity.into_pyarray(py).to_object(py);
-        let ion_mobility = match peaks.ion_mobility {
-            OptionalColumnBuf::AllNull { .. } => None,
-            OptionalColumnBuf::AllPresent(values) => Some(IonMobilityArrays {
-                values: values.into_pyarray(py).to_object(py),
-                validity: None,
-            }),
-            OptionalColumnBuf::WithValidity { values, validity } => Some(IonMobilityArrays {
-                values: values.into_pyarray(py).to_object(py),
-                validity: Some(validity.into_pyarray(py).to_object(py)),
-            }),
+        let shape = match peaks.ion_mobility {
+            OptionalColumnBuf::AllNull { .. } => PeakShape::MzIntensity,
+            OptionalColumnBuf::AllPresent(values) => PeakShape::MzIntensityIm {
+                ion_mobility: values.into_pyarray(py).to_object(py),
+            },
+            OptionalColumnBuf::WithValidity { values, validity } => {
+                PeakShape::MzIntensityImValidity {
+                    ion_mobility: values.into_pyarray(py).to_object(py),
+                    validity: validity.into_pyarray(py).to_object(py),
+                }
+            }
         };
 
         Self {
@@ -163,7 +253,7 @@ impl PySpectrumArrays {
             num_peaks,
             mz,
             intensity,
-            ion_mobility,
+            shape,
         }
     }
 }
@@ -233,45 +323,24 @@ impl PySpectrumArrays {
             )));
         }
 
-        let ion_mobility_arrays = match ion_mobility {
-            None => {
-                if ion_mobility_validity.is_some() {
-                    return Err(PyValueError::new_err(
-                        "ion_mobility_validity provided without ion_mobility values",
-                    ));
-                }
-                None
+        let shape = match (ion_mobility, ion_mobility_validity) {
+            (None, None) => PeakShape::MzIntensity,
+            (None, Some(_)) => {
+                return Err(PyValueError::new_err(
+                    "ion_mobility_validity provided without ion_mobility values",
+                ));
             }
-            Some(values_obj) => {
-                let values: PyReadonlyArray1<f64> = values_obj.extract(py)?;
-                let values_len = values.len()?;
-                if values_len != num_peaks {
-                    return Err(PyValueError::new_err(format!(
-                        "ion_mobility length {} does not match mz length {}",
-                        values_len,
-                        num_peaks,
-                    )));
-                }
-                let validity = match ion_mobility_validity {
-                    None => None,
-                    Some(validity_obj) => {
-                        let validity_array: PyReadonlyArray1<bool> =
-                            validity_obj.extract(py)?;
-                        let validity_len = validity_array.len()?;
-                        if validity_len != num_peaks {
-                            return Err(PyValueError::new_err(format!(
-                                "ion_mobility_validity length {} does not match mz length {}",
-                                validity_len,
-                                num_peaks,
-                            )));
-                        }
-                        Some(validity_obj)
-                    }
-                };
-                Some(IonMobilityArrays {
-                    values: values_obj,
+            (Some(ion_mobility), None) => {
+                check_len::<f64>(py, &ion_mobility, "ion_mobility", num_peaks)?;
+                PeakShape::MzIntensityIm { ion_mobility }
+            }
+            (Some(ion_mobility), Some(validity)) => {
+                check_len::<f64>(py, &ion_mobility, "ion_mobility", num_peaks)?;
+                check_len::<bool>(py, &validity, "ion_mobility_validity", num_peaks)?;
+                PeakShape::MzIntensityImValidity {
+                    ion_mobility,
                     validity,
-                })
+                }
             }
         };
 
@@ -297,7 +366,7 @@ impl PySpectrumArrays {
             num_peaks,
             mz,
             intensity,
-            ion_mobility: ion_mobility_arrays,
+            shape,
         })
     }
 
@@ -332,12 +401,16 @@ impl PySpectrumArrays {
     }
 
     /// m/z array (NumPy)
+    ///
+    /// Read-only for spectra returned by a reader, which borrow the decoded
+    /// Arrow buffers; copy with `numpy.array(...)` before modifying in place.
+    /// Arrays of a SpectrumArrays built in Python are returned as passed.
     #[getter]
     fn mz_array(&self, py: Python<'_>) -> PyObject {
         self.mz.clone_ref(py)
     }
 
-    /// Intensity array (NumPy)
+    /// Intensity array (NumPy); read-only for spectra returned by a reader
     #[getter]
     fn intensity_array(&self, py: Python<'_>) -> PyObject {
         self.intensity.clone_ref(py)
@@ -349,14 +422,17 @@ impl PySpectrumArrays {
     /// - None if no ion mobility data is present
     /// - values array if all values are present
     /// - (values, validity) tuple for sparse data
+    ///
+    /// Read-only for spectra returned by a reader, like `mz_array`.
     #[getter]
     fn ion_mobility_array(&self, py: Python<'_>) -> PyObject {
-        match &self.ion_mobility {
-            None => py.None(),
-            Some(arrays) => match &arrays.validity {
-                None => arrays.values.clone_ref(py),
-                Some(validity) => (arrays.values.clone_ref(py), validity.clone_ref(py)).into_py(py),
-            },
+        match &self.shape {
+            PeakShape::MzIntensity => py.None(),
+            PeakShape::MzIntensityIm { ion_mobility } => ion_mobility.clone_ref(py),
+            PeakShape::MzIntensityImValidity {
+                ion_mobility,
+                validity,
+            } => (ion_mobility.clone_ref(py), validity.clone_ref(py)).into_py(py),
         }
     }
 
@@ -471,3 +547,62 @@ fn extract_vec<T: numpy::Element + Copy>(
         .map_err(|_| PyValueError::new_err(format!("{} must be a contiguous 1D array", label)))?;
     Ok(slice.to_vec())
 }
+
+fn extract_vec_of_len<T: numpy::Element + Copy>(
+    py: Python<'_>,
+    obj: &PyObject,
+    label: &str,
+    expected: usize,
+) -> PyResult<Vec<T>> {
+    let values = extract_vec::<T>(py, obj, label)?;
+    if values.len() != expected {
+        return Err(PyValueError::new_err(format!(
+            "{} length {} does not match mz length {}",
+            label,
+            values.len(),
+            expected
+        )));
+    }
+    Ok(values)
+}
+
+fn check_len<T: numpy::Element>(
+    py: Python<'_>,
+    obj: &PyObject,
+    label: &str,
+    expected: usize,
+) -> PyResult<()> {
+    let array: PyReadonlyArray1<T> = obj.extract(py)?;
+    let len = array.len()?;
+    if len != expected {
+        return Err(PyValueError::new_err(format!(
+            "{} length {} does not match mz length {}",
+            label, len, expected
+        )));
+    }
+    Ok(())
+}
+
+/// Clear the writeable flag of a NumPy array
+fn set_readonly(py: Python<'_>, array: &PyObject) -> PyResult<()> {
+    let kwargs = pyo3::types::PyDict::new(py);
+    kwargs.set_item("write", false)?;
+    array.call_method(py, "setflags", (), Some(&kwargs))?;
+    Ok(())
+}
+
+/// Expand a bit-packed Arrow validity bitmap into one bool per value
+///
+/// Walks the bitmap a 64-bit word at a time rather than testing each bit
+/// through `NullBuffer::iter`, so the inner loop is plain shifts and stores
+/// that the compiler can vectorize.
+fn unpack_validity(nulls: &NullBuffer) -> Vec<bool> {
+    let len = nulls.len();
+    let mut out = Vec::with_capacity(len);
+    let chunks = nulls.inner().inner().bit_chunks(nulls.offset(), len);
+    for word in chunks.iter_padded() {
+        let take = (len - out.len()).min(64);
+        out.extend((0..take).map(|bit| (word >> bit) & 1 == 1));
+    }
+    out
+}
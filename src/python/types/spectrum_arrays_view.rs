@@ -48,7 +48,7 @@ fn create_array_capsule(
     Ok(capsule)
 }
 
-fn numpy_view_from_f64(py: Python<'_>, array: &Float64Array) -> PyResult<PyObject> {
+pub(crate) fn numpy_view_from_f64(py: Python<'_>, array: &Float64Array) -> PyResult<PyObject> {
     let values = array.values();
     let len = values.len();
     let mut dims = [len as npy_intp];
@@ -96,7 +96,7 @@ fn numpy_view_from_f64(py: Python<'_>, array: &Float64Array) -> PyResult<PyObjec
     Ok(unsafe { PyObject::from_owned_ptr(py, array_ptr) })
 }
 
-fn numpy_view_from_f32(py: Python<'_>, array: &Float32Array) -> PyResult<PyObject> {
+pub(crate) fn numpy_view_from_f32(py: Python<'_>, array: &Float32Array) -> PyResult<PyObject> {
     let values = array.values();
     let len = values.len();
     let mut dims = [len as npy_intp];
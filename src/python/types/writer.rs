@@ -18,31 +18,28 @@ impl PyWriterConfig {
     ///     compression_level: ZSTD compression level (1-22, default 9)
     ///     row_group_size: Number of rows per row group (default 100000)
     ///     data_page_size: Data page size in bytes (default 1MB)
+    ///     metadata_compression: Compression for the ms_level, polarity and
+    ///         precursor_charge columns (default "none"; None uses `compression`)
     #[new]
-    #[pyo3(signature = (compression="zstd", compression_level=9, row_group_size=100000, data_page_size=1048576))]
+    #[pyo3(signature = (compression="zstd", compression_level=9, row_group_size=100000, data_page_size=1048576, metadata_compression=Some("none")))]
     fn new(
         compression: &str,
         compression_level: i32,
         row_group_size: usize,
         data_page_size: usize,
+        metadata_compression: Option<&str>,
     ) -> PyResult<Self> {
-        let compression_type = match compression.to_lowercase().as_str() {
-            "zstd" => CompressionType::Zstd(compression_level),
-            "snappy" => CompressionType::Snappy,
-            "none" | "uncompressed" => CompressionType::Uncompressed,
-            _ => {
-                return Err(pyo3::exceptions::PyValueError::new_err(format!(
-                    "Unknown compression type: {}. Use 'zstd', 'snappy', or 'none'.",
-                    compression
-                )))
-            }
-        };
+        let compression_type = parse_compression(compression, compression_level)?;
+        let metadata_compression = metadata_compression
+            .map(|name| parse_compression(name, compression_level))
+            .transpose()?;
 
         Ok(Self {
             inner: WriterConfig {
                 compression: compression_type,
                 row_group_size,
                 data_page_size,
+                metadata_compression,
                 ..Default::default()
             },
         })
@@ -76,6 +73,18 @@ impl PyWriterConfig {
     }
 }
 
+fn parse_compression(name: &str, level: i32) -> PyResult<CompressionType> {
+    match name.to_lowercase().as_str() {
+        "zstd" => Ok(CompressionType::Zstd(level)),
+        "snappy" => Ok(CompressionType::Snappy),
+        "none" | "uncompressed" => Ok(CompressionType::Uncompressed),
+        _ => Err(pyo3::exceptions::PyValueError::new_err(format!(
+            "Unknown compression type: {}. Use 'zstd', 'snappy', or 'none'.",
+            name
+        ))),
+    }
+}
+
 impl Default for PyWriterConfig {
     fn default() -> Self {
         Self {
@@ -2,8 +2,11 @@
 //!
 //! Provides write access to create mzPeak files with context manager support.
 
+use numpy::PyReadonlyArray1;
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 use std::fs::File;
+use std::path::PathBuf;
 
 use crate::dataset::{MzPeakDatasetWriter, OutputMode};
 use crate::metadata::MzPeakMetadata;
@@ -29,8 +32,15 @@ use crate::writer::{MzPeakWriter, Peak, Spectrum, SpectrumArrays, SpectrumBuilde
 #[pyclass(name = "MzPeakWriter", unsendable)]
 pub struct PyMzPeakWriter {
     inner: Option<MzPeakWriter<File>>,
-    path: String,
+    path: PathBuf,
     closed: bool,
+    /// Spectra buffered so that many small writes become one record batch.
+    /// At most one of the two buffers is non-empty, which keeps write order.
+    pending_spectra: Vec<Spectrum>,
+    pending_arrays: Vec<SpectrumArrays>,
+    pending_peaks: usize,
+    /// Buffered peak count that triggers a flush (one row group's worth)
+    flush_threshold: usize,
 }
 
 #[pymethods]
@@ -40,36 +50,64 @@ impl PyMzPeakWriter {
     /// Args:
     ///     path: Output file path (should end with .parquet or .mzpeak.parquet)
     ///     config: Optional WriterConfig for compression and batching settings
+    ///     row_group_size: Peaks per row group; overrides config.row_group_size.
+    ///         Writes are buffered until this many peaks are pending.
     ///
     /// Returns:
     ///     MzPeakWriter instance
     #[new]
-    #[pyo3(signature = (path, config=None))]
-    fn new(path: String, config: Option<PyWriterConfig>) -> PyResult<Self> {
-        let writer_config = config.map(|c| c.inner).unwrap_or_default();
+    #[pyo3(signature = (path, config=None, row_group_size=None))]
+    fn new(
+        py: Python<'_>,
+        path: PathBuf,
+        config: Option<PyWriterConfig>,
+        row_group_size: Option<usize>,
+    ) -> PyResult<Self> {
+        let mut writer_config = config.map(|c| c.inner).unwrap_or_default();
+        if let Some(size) = row_group_size {
+            if size == 0 {
+                return Err(PyValueError::new_err("row_group_size must be positive"));
+            }
+            writer_config.row_group_size = size;
+        }
+        let flush_threshold = writer_config.row_group_size;
         let metadata = MzPeakMetadata::new();
 
-        let writer =
-            MzPeakWriter::new_file(&path, &metadata, writer_config).into_py_result()?;
+        let writer = py.allow_threads(|| {
+            MzPeakWriter::new_file(&path, &metadata, writer_config).into_py_result()
+        })?;
 
         Ok(Self {
             inner: Some(writer),
             path,
             closed: false,
+            pending_spectra: Vec::new(),
+            pending_arrays: Vec::new(),
+            pending_peaks: 0,
+            flush_threshold,
         })
     }
 
     /// Write a single spectrum
     ///
+    /// Spectra are buffered and written together once a row group's worth of
+    /// peaks accumulates, or when the writer is closed.
+    ///
     /// Args:
     ///     spectrum: Spectrum object to write
     fn write_spectrum(&mut self, py: Python<'_>, spectrum: PySpectrum) -> PyResult<()> {
-        let writer = self.get_writer_mut()?;
-        py.allow_threads(|| writer.write_spectrum(&spectrum.inner).into_py_result())
+        self.get_writer()?;
+        self.flush_pending_arrays(py)?;
+        self.pending_peaks += spectrum.inner.peaks.len();
+        self.pending_spectra.push(spectrum.inner);
+        self.maybe_flush_pending(py)
     }
 
     /// Write a single spectrum using SoA arrays
     ///
+    /// Spectra are buffered and written together as one record batch once
+    /// a row group's worth of peaks accumulates, or when the writer is closed.
+    ///
     /// Args:
     ///     spectrum: SpectrumArrays object to write
     fn write_spectrum_arrays(
@@ -77,23 +115,36 @@ impl PyMzPeakWriter {
         py: Python<'_>,
         spectrum: PyRef<'_, PySpectrumArrays>,
     ) -> PyResult<()> {
-        let writer = self.get_writer_mut()?;
+        self.get_writer()?;
+        self.flush_pending_spectra(py)?;
         let rust_spectrum = spectrum.to_rust(py)?;
-        py.allow_threads(|| writer.write_spectrum_arrays(&rust_spectrum).into_py_result())
+        self.pending_peaks += rust_spectrum.peak_count();
+        self.pending_arrays.push(rust_spectrum);
+        self.maybe_flush_pending(py)
     }
 
     /// Write multiple spectra in a batch
     ///
+    /// Spectra join the same buffer as `write_spectrum`, so many small calls
+    /// still produce full row groups.
+    ///
     /// Args:
     ///     spectra: List of Spectrum objects to write
     fn write_spectra(&mut self, py: Python<'_>, spectra: Vec<PySpectrum>) -> PyResult<()> {
-        let writer = self.get_writer_mut()?;
-        let rust_spectra: Vec<Spectrum> = spectra.into_iter().map(|s| s.inner).collect();
-        py.allow_threads(|| writer.write_spectra(&rust_spectra).into_py_result())
+        self.get_writer()?;
+        self.flush_pending_arrays(py)?;
+        self.pending_spectra.reserve(spectra.len());
+        for spectrum in spectra {
+            self.pending_peaks += spectrum.inner.peaks.len();
+            self.pending_spectra.push(spectrum.inner);
+        }
+        self.maybe_flush_pending(py)
     }
 
     /// Write multiple spectra using SoA arrays
     ///
+    /// Spectra join the same buffer as `write_spectrum_arrays`.
+    ///
     /// Args:
     ///     spectra: List of SpectrumArrays objects to write
     fn write_spectra_arrays(
@@ -101,21 +152,27 @@ impl PyMzPeakWriter {
         py: Python<'_>,
         spectra: Vec<Py<PySpectrumArrays>>,
     ) -> PyResult<()> {
-        let writer = self.get_writer_mut()?;
-        let mut rust_spectra: Vec<SpectrumArrays> = Vec::with_capacity(spectra.len());
+        self.get_writer()?;
+        self.flush_pending_spectra(py)?;
+        self.pending_arrays.reserve(spectra.len());
         for spectrum in spectra {
             let spectrum_ref = spectrum.bind(py).borrow();
-            rust_spectra.push(spectrum_ref.to_rust(py)?);
+            let rust_spectrum = spectrum_ref.to_rust(py)?;
+            self.pending_peaks += rust_spectrum.peak_count();
+            self.pending_arrays.push(rust_spectrum);
         }
-        py.allow_threads(|| writer.write_spectra_arrays(&rust_spectra).into_py_result())
+        self.maybe_flush_pending(py)
     }
 
 
     /// Get current writer statistics
     ///
+    /// Buffered spectra are flushed first so the counts are exact.
+    ///
     /// Returns:
     ///     WriterStats with counts of spectra and peaks written
-    fn stats(&self) -> PyResult<PyWriterStats> {
+    fn stats(&mut self, py: Python<'_>) -> PyResult<PyWriterStats> {
+        self.flush_pending(py)?;
         let writer = self.get_writer()?;
         Ok(PyWriterStats::from(writer.stats()))
     }
@@ -135,6 +192,7 @@ impl PyMzPeakWriter {
             ));
         }
 
+        self.flush_pending(py)?;
         let writer = self.inner.take().ok_or_else(|| {
             pyo3::exceptions::PyRuntimeError::new_err("Writer is not initialized")
         })?;
@@ -171,9 +229,9 @@ impl PyMzPeakWriter {
 
     fn __repr__(&self) -> String {
         if self.is_open() {
-            format!("MzPeakWriter('{}', open=True)", self.path)
+            format!("MzPeakWriter('{}', open=True)", self.path.display())
         } else {
-            format!("MzPeakWriter('{}', open=False)", self.path)
+            format!("MzPeakWriter('{}', open=False)", self.path.display())
         }
     }
 }
@@ -200,6 +258,40 @@ impl PyMzPeakWriter {
             pyo3::exceptions::PyRuntimeError::new_err("Writer is not initialized")
         })
     }
+
+    fn maybe_flush_pending(&mut self, py: Python<'_>) -> PyResult<()> {
+        if self.pending_peaks >= self.flush_threshold {
+            self.flush_pending(py)?;
+        }
+        Ok(())
+    }
+
+    fn flush_pending(&mut self, py: Python<'_>) -> PyResult<()> {
+        self.flush_pending_spectra(py)?;
+        self.flush_pending_arrays(py)
+    }
+
+    /// Write all buffered spectra in a single call
+    fn flush_pending_spectra(&mut self, py: Python<'_>) -> PyResult<()> {
+        if self.pending_spectra.is_empty() {
+            return Ok(());
+        }
+        let pending = std::mem::take(&mut self.pending_spectra);
+        self.pending_peaks = 0;
+        let writer = self.get_writer_mut()?;
+        py.allow_threads(|| writer.write_spectra(&pending).into_py_result())
+    }
+
+    /// Write all buffered SoA spectra as a single pre-sized record batch
+    fn flush_pending_arrays(&mut self, py: Python<'_>) -> PyResult<()> {
+        if self.pending_arrays.is_empty() {
+            return Ok(());
+        }
+        let pending = std::mem::take(&mut self.pending_arrays);
+        self.pending_peaks = 0;
+        let writer = self.get_writer_mut()?;
+        py.allow_threads(|| writer.write_spectra_arrays(&pending).into_py_result())
+    }
 }
 
 /// Writer for creating mzPeak dataset bundles
@@ -218,7 +310,7 @@ impl PyMzPeakWriter {
 #[pyclass(name = "MzPeakDatasetWriter", unsendable)]
 pub struct PyMzPeakDatasetWriter {
     inner: Option<MzPeakDatasetWriter>,
-    path: String,
+    path: PathBuf,
     closed: bool,
     output_mode: OutputMode,
 }
@@ -236,15 +328,22 @@ impl PyMzPeakDatasetWriter {
     ///     MzPeakDatasetWriter instance
     #[new]
     #[pyo3(signature = (path, config=None, use_container=true))]
-    fn new(path: String, config: Option<PyWriterConfig>, use_container: bool) -> PyResult<Self> {
+    fn new(
+        py: Python<'_>,
+        path: PathBuf,
+        config: Option<PyWriterConfig>,
+        use_container: bool,
+    ) -> PyResult<Self> {
         let writer_config = config.map(|c| c.inner).unwrap_or_default();
         let metadata = MzPeakMetadata::new();
 
-        let (writer, mode) = if use_container {
-            (MzPeakDatasetWriter::new_container(&path, &metadata, writer_config), OutputMode::Container)
-        } else {
-            (MzPeakDatasetWriter::new_directory(&path, &metadata, writer_config), OutputMode::Directory)
-        };
+        let (writer, mode) = py.allow_threads(|| {
+            if use_container {
+                (MzPeakDatasetWriter::new_container(&path, &metadata, writer_config), OutputMode::Container)
+            } else {
+                (MzPeakDatasetWriter::new_directory(&path, &metadata, writer_config), OutputMode::Directory)
+            }
+        });
         let writer = writer.into_py_result()?;
 
         Ok(Self {
@@ -415,9 +514,9 @@ impl PyMzPeakDatasetWriter {
 
     fn __repr__(&self) -> String {
         if self.is_open() {
-            format!("MzPeakDatasetWriter('{}', open=True)", self.path)
+            format!("MzPeakDatasetWriter('{}', open=True)", self.path.display())
         } else {
-            format!("MzPeakDatasetWriter('{}', open=False)", self.path)
+            format!("MzPeakDatasetWriter('{}', open=False)", self.path.display())
         }
     }
 }
@@ -459,6 +558,32 @@ impl PyMzPeakDatasetWriter {
 #[pyclass(name = "SpectrumBuilder")]
 pub struct PySpectrumBuilder {
     inner: SpectrumBuilder,
+    /// Peaks added so far, handed to the builder in one piece by `build`
+    peaks: Vec<Peak>,
+}
+
+impl PySpectrumBuilder {
+    /// Append peaks from parallel m/z and intensity slices
+    ///
+    /// Reserves space once and appends in a single pass, so adding N peaks
+    /// costs one allocation at most instead of N pushes.
+    pub(crate) fn extend_peaks(&mut self, mz: &[f64], intensity: &[f32]) -> PyResult<()> {
+        if mz.len() != intensity.len() {
+            return Err(PyValueError::new_err(format!(
+                "intensity length {} does not match mz length {}",
+                intensity.len(),
+                mz.len(),
+            )));
+        }
+        self.peaks.reserve(mz.len());
+        self.peaks
+            .extend(mz.iter().zip(intensity).map(|(&mz, &intensity)| Peak {
+                mz,
+                intensity,
+                ion_mobility: None,
+            }));
+        Ok(())
+    }
 }
 
 #[pymethods]
@@ -472,6 +597,7 @@ impl PySpectrumBuilder {
     fn new(spectrum_id: i64, scan_number: i64) -> Self {
         Self {
             inner: SpectrumBuilder::new(spectrum_id, scan_number),
+            peaks: Vec::new(),
         }
     }
 
@@ -553,8 +679,7 @@ impl PySpectrumBuilder {
     /// Args:
     ///     peaks: List of Peak objects
     fn peaks(mut slf: PyRefMut<'_, Self>, peaks: Vec<PyPeak>) -> PyRefMut<'_, Self> {
-        let rust_peaks: Vec<Peak> = peaks.into_iter().map(|p| p.into()).collect();
-        slf.inner = std::mem::take(&mut slf.inner).peaks(rust_peaks);
+        slf.peaks = peaks.into_iter().map(|p| p.into()).collect();
         slf
     }
 
@@ -564,10 +689,34 @@ impl PySpectrumBuilder {
     ///     mz: Mass-to-charge ratio
     ///     intensity: Signal intensity
     fn add_peak(mut slf: PyRefMut<'_, Self>, mz: f64, intensity: f32) -> PyRefMut<'_, Self> {
-        slf.inner = std::mem::take(&mut slf.inner).add_peak(mz, intensity);
+        slf.peaks.push(Peak {
+            mz,
+            intensity,
+            ion_mobility: None,
+        });
         slf
     }
 
+    /// Add many peaks from NumPy arrays in one call
+    ///
+    /// Equivalent to calling `add_peak` for each pair, without crossing the
+    /// Python/Rust boundary per peak.
+    ///
+    /// Args:
+    ///     mz: 1D float64 array of m/z values
+    ///     intensity: 1D float32 array of intensities, same length as `mz`
+    ///
+    /// Raises:
+    ///     ValueError: If the arrays differ in length or are not contiguous
+    fn add_peaks<'py>(
+        mut slf: PyRefMut<'py, Self>,
+        mz: PyReadonlyArray1<'py, f64>,
+        intensity: PyReadonlyArray1<'py, f32>,
+    ) -> PyResult<PyRefMut<'py, Self>> {
+        slf.extend_peaks(mz.as_slice()?, intensity.as_slice()?)?;
+        Ok(slf)
+    }
+
     /// Add a peak with ion mobility
     ///
     /// Args:
@@ -580,7 +729,11 @@ impl PySpectrumBuilder {
         intensity: f32,
         ion_mobility: f64,
     ) -> PyRefMut<'_, Self> {
-        slf.inner = std::mem::take(&mut slf.inner).add_peak_with_im(mz, intensity, ion_mobility);
+        slf.peaks.push(Peak {
+            mz,
+            intensity,
+            ion_mobility: Some(ion_mobility),
+        });
         slf
     }
 
@@ -589,7 +742,8 @@ impl PySpectrumBuilder {
     /// Returns:
     ///     Spectrum object with all configured properties
     fn build(&mut self) -> PySpectrum {
-        let spectrum = std::mem::take(&mut self.inner).build();
+        let peaks = std::mem::take(&mut self.peaks);
+        let spectrum = std::mem::take(&mut self.inner).peaks(peaks).build();
         PySpectrum::from(spectrum)
     }
 
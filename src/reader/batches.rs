@@ -2,6 +2,10 @@ use std::fs::File;
 
 use arrow::record_batch::RecordBatch;
 use parquet::arrow::arrow_reader::ParquetRecordBatchReaderBuilder;
+#[cfg(feature = "rayon")]
+use parquet::arrow::arrow_reader::{ArrowReaderMetadata, ArrowReaderOptions};
+#[cfg(feature = "rayon")]
+use parquet::file::reader::ChunkReader;
 
 use super::config::ReaderSource;
 use super::{MzPeakReader, ReaderError};
@@ -50,7 +54,19 @@ impl MzPeakReader {
     /// }
     /// # Ok::<(), mzpeak::reader::ReaderError>(())
     /// ```
+    ///
+    /// With [`ReaderConfig::cache_batches`] set, the first call decodes the whole
+    /// table and later calls iterate over the cached batches.
     pub fn iter_batches(&self) -> Result<RecordBatchIterator, ReaderError> {
+        if self.config.cache_batches {
+            let batches = self.cached_batches()?.to_vec();
+            return Ok(RecordBatchIterator::new(batches.into_iter().map(Ok)));
+        }
+        self.decode_batches()
+    }
+
+    /// Streaming decode of the peak table, bypassing the batch cache
+    fn decode_batches(&self) -> Result<RecordBatchIterator, ReaderError> {
         match &self.source {
             ReaderSource::FilePath(path) => {
                 let file = File::open(path)?;
@@ -59,6 +75,12 @@ impl MzPeakReader {
                 let reader = builder.build()?;
                 Ok(RecordBatchIterator::new(reader))
             }
+            ReaderSource::InMemory { data, .. } => {
+                let builder = ParquetRecordBatchReaderBuilder::try_new(data.clone())?
+                    .with_batch_size(self.config.batch_size);
+                let reader = builder.build()?;
+                Ok(RecordBatchIterator::new(reader))
+            }
             ReaderSource::ZipContainer { chunk_reader, .. } => {
                 // Use the seekable chunk reader for streaming access (Issue 002 fix)
                 // This avoids loading the entire Parquet file into memory
@@ -75,8 +97,80 @@ impl MzPeakReader {
     /// Returns the raw Arrow record batches for efficient data access.
     /// Useful for zero-copy integration with data processing libraries.
     ///
+    /// With the `rayon` feature, row groups are decoded in parallel and the
+    /// batches are returned in file order.
+    ///
     /// **Warning**: This loads all data into memory. For large files, prefer `iter_batches()`.
     pub fn read_all_batches(&self) -> Result<Vec<RecordBatch>, ReaderError> {
-        self.iter_batches()?.collect()
+        if self.config.cache_batches {
+            return Ok(self.cached_batches()?.to_vec());
+        }
+        self.decode_all_batches()
+    }
+
+    /// Drop batches kept by [`ReaderConfig::cache_batches`]
+    ///
+    /// The next full read decodes the file again and refills the cache.
+    pub fn drop_cache(&mut self) {
+        self.batch_cache.take();
+    }
+
+    fn cached_batches(&self) -> Result<&[RecordBatch], ReaderError> {
+        if let Some(batches) = self.batch_cache.get() {
+            return Ok(batches);
+        }
+        let batches = self.decode_all_batches()?;
+        Ok(self.batch_cache.get_or_init(|| batches))
+    }
+
+    fn decode_all_batches(&self) -> Result<Vec<RecordBatch>, ReaderError> {
+        #[cfg(feature = "rayon")]
+        if self.file_metadata.num_row_groups > 1 {
+            return match &self.source {
+                ReaderSource::FilePath(path) => {
+                    self.read_row_groups_parallel(|| Ok(File::open(path)?))
+                }
+                ReaderSource::InMemory { data, .. } => {
+                    self.read_row_groups_parallel(|| Ok(data.clone()))
+                }
+                ReaderSource::ZipContainer { chunk_reader, .. } => {
+                    self.read_row_groups_parallel(|| Ok(chunk_reader.clone()))
+                }
+            };
+        }
+
+        self.decode_batches()?.collect()
+    }
+
+    /// Decode every row group on the rayon pool
+    ///
+    /// The footer is parsed once and shared; `open` supplies an independent
+    /// reader for each row group.
+    #[cfg(feature = "rayon")]
+    fn read_row_groups_parallel<T, F>(&self, open: F) -> Result<Vec<RecordBatch>, ReaderError>
+    where
+        T: ChunkReader + 'static,
+        F: Fn() -> Result<T, ReaderError> + Sync,
+    {
+        use rayon::prelude::*;
+
+        let metadata = ArrowReaderMetadata::load(&open()?, ArrowReaderOptions::default())?;
+        let batch_size = self.config.batch_size;
+
+        let per_row_group = (0..metadata.metadata().num_row_groups())
+            .into_par_iter()
+            .map(|row_group| {
+                let reader =
+                    ParquetRecordBatchReaderBuilder::new_with_metadata(open()?, metadata.clone())
+                        .with_batch_size(batch_size)
+                        .with_row_groups(vec![row_group])
+                        .build()?;
+                reader
+                    .collect::<Result<Vec<_>, _>>()
+                    .map_err(ReaderError::from)
+            })
+            .collect::<Result<Vec<_>, ReaderError>>()?;
+
+        Ok(per_row_group.into_iter().flatten().collect())
     }
 }
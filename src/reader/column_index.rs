@@ -0,0 +1,99 @@
+use arrow::array::Array;
+use arrow::datatypes::Schema;
+use arrow::record_batch::RecordBatch;
+
+use crate::schema::columns;
+
+use super::ReaderError;
+
+/// Positions of the peak-table columns, resolved once from the file schema
+///
+/// Every record batch read from the peak table (without a projection) shares
+/// the file schema, so per-spectrum accessors index columns directly instead
+/// of matching column names on each call. Columns missing from the file are
+/// `None`.
+#[derive(Debug, Clone, Default)]
+pub(super) struct PeakColumns {
+    pub spectrum_id: Option<usize>,
+    pub scan_number: Option<usize>,
+    pub ms_level: Option<usize>,
+    pub retention_time: Option<usize>,
+    pub polarity: Option<usize>,
+    pub mz: Option<usize>,
+    pub intensity: Option<usize>,
+    pub ion_mobility: Option<usize>,
+    pub precursor_mz: Option<usize>,
+    pub precursor_charge: Option<usize>,
+    pub precursor_intensity: Option<usize>,
+    pub isolation_window_lower: Option<usize>,
+    pub isolation_window_upper: Option<usize>,
+    pub collision_energy: Option<usize>,
+    pub total_ion_current: Option<usize>,
+    pub base_peak_mz: Option<usize>,
+    pub base_peak_intensity: Option<usize>,
+    pub injection_time: Option<usize>,
+    pub pixel_x: Option<usize>,
+    pub pixel_y: Option<usize>,
+    pub pixel_z: Option<usize>,
+}
+
+impl PeakColumns {
+    /// Look up every peak-table column in `schema`
+    ///
+    /// The indices are only valid for unprojected batches that use the file
+    /// schema. A batch read with a projection has different column positions,
+    /// and indexing it with these values would return the wrong columns
+    /// without an error.
+    pub(super) fn resolve(schema: &Schema) -> Self {
+        let find = |name: &str| schema.index_of(name).ok();
+        Self {
+            spectrum_id: find(columns::SPECTRUM_ID),
+            scan_number: find(columns::SCAN_NUMBER),
+            ms_level: find(columns::MS_LEVEL),
+            retention_time: find(columns::RETENTION_TIME),
+            polarity: find(columns::POLARITY),
+            mz: find(columns::MZ),
+            intensity: find(columns::INTENSITY),
+            ion_mobility: find(columns::ION_MOBILITY),
+            precursor_mz: find(columns::PRECURSOR_MZ),
+            precursor_charge: find(columns::PRECURSOR_CHARGE),
+            precursor_intensity: find(columns::PRECURSOR_INTENSITY),
+            isolation_window_lower: find(columns::ISOLATION_WINDOW_LOWER),
+            isolation_window_upper: find(columns::ISOLATION_WINDOW_UPPER),
+            collision_energy: find(columns::COLLISION_ENERGY),
+            total_ion_current: find(columns::TOTAL_ION_CURRENT),
+            base_peak_mz: find(columns::BASE_PEAK_MZ),
+            base_peak_intensity: find(columns::BASE_PEAK_INTENSITY),
+            injection_time: find(columns::INJECTION_TIME),
+            pixel_x: find(columns::PIXEL_X),
+            pixel_y: find(columns::PIXEL_Y),
+            pixel_z: find(columns::PIXEL_Z),
+        }
+    }
+}
+
+/// Get a required column by pre-resolved index.
+pub(super) fn column_at<'a, T: Array + 'static>(
+    batch: &'a RecordBatch,
+    index: Option<usize>,
+    name: &str,
+) -> Result<&'a T, ReaderError> {
+    let column = index
+        .and_then(|i| batch.columns().get(i))
+        .ok_or_else(|| ReaderError::ColumnNotFound(name.to_string()))?;
+    column.as_any().downcast_ref::<T>().ok_or_else(|| {
+        ReaderError::InvalidFormat(format!(
+            "{} has unexpected type {}",
+            name,
+            column.data_type()
+        ))
+    })
+}
+
+/// Get an optional column by pre-resolved index.
+pub(super) fn optional_column_at<T: Array + 'static>(
+    batch: &RecordBatch,
+    index: Option<usize>,
+) -> Option<&T> {
+    batch.columns().get(index?)?.as_any().downcast_ref::<T>()
+}
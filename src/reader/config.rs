@@ -5,11 +5,26 @@ use super::zip_chunk_reader::SharedZipEntryReader;
 pub struct ReaderConfig {
     /// Batch size for reading records
     pub batch_size: usize,
+    /// Memory-map single Parquet files instead of reading through `File`
+    ///
+    /// Only honoured when built with the `mmap` feature; ZIP containers are
+    /// always read through their entry reader.
+    pub use_mmap: bool,
+    /// Keep the decoded peak table after the first full read
+    ///
+    /// Later `read_all_batches`/`iter_batches` calls, and everything built on
+    /// them, reuse the cached batches instead of decoding the file again. The
+    /// whole table stays in memory until `MzPeakReader::drop_cache`.
+    pub cache_batches: bool,
 }
 
 impl Default for ReaderConfig {
     fn default() -> Self {
-        Self { batch_size: 65536 }
+        Self {
+            batch_size: 65536,
+            use_mmap: false,
+            cache_batches: false,
+        }
     }
 }
 
@@ -20,6 +35,15 @@ impl Default for ReaderConfig {
 pub(super) enum ReaderSource {
     /// File path for file-based reading (single Parquet file)
     FilePath(std::path::PathBuf),
+    /// Single Parquet file held in memory (memory-mapped or caller-supplied)
+    ///
+    /// Column chunks are sliced out of the buffer without copying.
+    InMemory {
+        /// Shared view of the file contents
+        data: bytes::Bytes,
+        /// Path the bytes were mapped from, if any (for subfile access)
+        path: Option<std::path::PathBuf>,
+    },
     /// Seekable reader for ZIP container format (.mzpeak files)
     /// Uses `SharedZipEntryReader` for bounded memory usage
     ZipContainer {
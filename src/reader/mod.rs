@@ -34,6 +34,7 @@
 //! ```
 
 mod batches;
+mod column_index;
 mod config;
 mod error;
 mod metadata;
@@ -64,4 +65,8 @@ pub struct MzPeakReader {
     source: ReaderSource,
     config: ReaderConfig,
     file_metadata: FileMetadata,
+    /// Peak-table column positions, resolved from the schema at open
+    columns: std::sync::Arc<column_index::PeakColumns>,
+    /// Decoded peak batches, filled when `config.cache_batches` is set
+    batch_cache: std::sync::OnceLock<Vec<arrow::record_batch::RecordBatch>>,
 }
@@ -1,8 +1,10 @@
 use std::fs::File;
 use std::path::Path;
+use std::sync::Arc;
 
 use parquet::file::reader::SerializedFileReader;
 
+use super::column_index::PeakColumns;
 use super::config::ReaderSource;
 use super::zip_chunk_reader::{SharedZipEntryReader, ZipEntryChunkReader};
 use super::{MzPeakReader, ReaderConfig, ReaderError};
@@ -44,6 +46,32 @@ impl MzPeakReader {
         }
     }
 
+    /// Read a single mzPeak Parquet file that is already in memory
+    ///
+    /// The buffer is shared, not copied. Readers built this way have no
+    /// chromatogram or mobilogram sub-files.
+    pub fn from_bytes(data: impl Into<bytes::Bytes>) -> Result<Self, ReaderError> {
+        Self::from_bytes_with_config(data, ReaderConfig::default())
+    }
+
+    /// Read an in-memory mzPeak Parquet file with custom configuration
+    pub fn from_bytes_with_config(
+        data: impl Into<bytes::Bytes>,
+        config: ReaderConfig,
+    ) -> Result<Self, ReaderError> {
+        let data = data.into();
+        let parquet_reader = SerializedFileReader::new(data.clone())?;
+        let file_metadata = Self::extract_file_metadata(&parquet_reader)?;
+
+        Ok(Self {
+            source: ReaderSource::InMemory { data, path: None },
+            config,
+            columns: Arc::new(PeakColumns::resolve(&file_metadata.schema)),
+            file_metadata,
+            batch_cache: Default::default(),
+        })
+    }
+
     /// Open a ZIP container format file
     ///
     /// Uses `SharedZipEntryReader` for streaming access without loading the
@@ -65,7 +93,9 @@ impl MzPeakReader {
                 zip_path,
             },
             config,
+            columns: Arc::new(PeakColumns::resolve(&file_metadata.schema)),
             file_metadata,
+            batch_cache: Default::default(),
         })
     }
 
@@ -76,6 +106,28 @@ impl MzPeakReader {
     ) -> Result<Self, ReaderError> {
         let path = path.as_ref().to_path_buf();
         let file = File::open(&path)?;
+
+        #[cfg(feature = "mmap")]
+        if config.use_mmap {
+            // SAFETY: the mapping is only read, and mzPeak files are not
+            // expected to be modified while a reader has them open.
+            let mmap = unsafe { memmap2::Mmap::map(&file)? };
+            let data = bytes::Bytes::from_owner(mmap);
+            let parquet_reader = SerializedFileReader::new(data.clone())?;
+            let file_metadata = Self::extract_file_metadata(&parquet_reader)?;
+
+            return Ok(Self {
+                source: ReaderSource::InMemory {
+                    data,
+                    path: Some(path),
+                },
+                config,
+                columns: Arc::new(PeakColumns::resolve(&file_metadata.schema)),
+                file_metadata,
+                batch_cache: Default::default(),
+            });
+        }
+
         let parquet_reader = SerializedFileReader::new(file)?;
 
         let file_metadata = Self::extract_file_metadata(&parquet_reader)?;
@@ -83,7 +135,9 @@ impl MzPeakReader {
         Ok(Self {
             source: ReaderSource::FilePath(path),
             config,
+            columns: Arc::new(PeakColumns::resolve(&file_metadata.schema)),
             file_metadata,
+            batch_cache: Default::default(),
         })
     }
 }
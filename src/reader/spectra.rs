@@ -1,7 +1,12 @@
 use std::collections::HashSet;
 use std::fs::File;
+use std::sync::Arc;
 
-use arrow::array::{Array, Float32Array, Float64Array};
+use arrow::array::{
+    Array, Float32Array, Float64Array, Int16Array, Int32Array, Int64Array, Int8Array,
+    PrimitiveArray,
+};
+use arrow::datatypes::{ArrowPrimitiveType, Float32Type, Float64Type};
 use arrow::record_batch::RecordBatch;
 use parquet::arrow::arrow_reader::ParquetRecordBatchReaderBuilder;
 use parquet::file::metadata::ParquetMetaData;
@@ -10,12 +15,9 @@ use parquet::file::statistics::Statistics;
 use crate::schema::columns;
 use crate::writer::{OptionalColumnBuf, PeakArrays, SpectrumArrays};
 
+use super::column_index::{column_at, optional_column_at, PeakColumns};
 use super::config::ReaderSource;
-use super::utils::{
-    get_float32_column, get_float64_column, get_int16_column, get_int64_column, get_int8_column,
-    get_optional_f32, get_optional_f64, get_optional_float32_column, get_optional_float64_column,
-    get_optional_i16, get_optional_i32, get_optional_int16_column, get_optional_int32_column,
-};
+use super::utils::{get_optional_f32, get_optional_f64, get_optional_i16, get_optional_i32};
 use super::{MzPeakReader, ReaderError, RecordBatchIterator};
 
 fn spectrum_id_column_index(metadata: &ParquetMetaData) -> Option<usize> {
@@ -101,6 +103,11 @@ impl MzPeakReader {
                     max_id,
                 )
             }
+            ReaderSource::InMemory { data, .. } => self.build_iter_for_spectrum_id_range(
+                ParquetRecordBatchReaderBuilder::try_new(data.clone())?,
+                min_id,
+                max_id,
+            ),
             ReaderSource::ZipContainer { chunk_reader, .. } => self.build_iter_for_spectrum_id_range(
                 ParquetRecordBatchReaderBuilder::try_new(chunk_reader.clone())?,
                 min_id,
@@ -126,7 +133,10 @@ impl MzPeakReader {
         &self,
     ) -> Result<StreamingSpectrumArraysViewIterator, ReaderError> {
         let batch_iter = self.iter_batches()?;
-        Ok(StreamingSpectrumArraysViewIterator::new(batch_iter))
+        Ok(StreamingSpectrumArraysViewIterator::new(
+            batch_iter,
+            Arc::clone(&self.columns),
+        ))
     }
 
     /// Query spectra by retention time range (inclusive), SoA layout
@@ -160,7 +170,7 @@ impl MzPeakReader {
         spectrum_id: i64,
     ) -> Result<Option<SpectrumArraysView>, ReaderError> {
         let batch_iter = self.iter_batches_for_spectrum_id_range(spectrum_id, spectrum_id)?;
-        let iter = StreamingSpectrumArraysViewIterator::new(batch_iter);
+        let iter = StreamingSpectrumArraysViewIterator::new(batch_iter, Arc::clone(&self.columns));
         for spectrum in iter {
             let spectrum = spectrum?;
             if spectrum.spectrum_id == spectrum_id {
@@ -183,7 +193,7 @@ impl MzPeakReader {
         let min_id = **id_set.iter().min().unwrap();
         let max_id = **id_set.iter().max().unwrap();
         let batch_iter = self.iter_batches_for_spectrum_id_range(min_id, max_id)?;
-        let iter = StreamingSpectrumArraysViewIterator::new(batch_iter);
+        let iter = StreamingSpectrumArraysViewIterator::new(batch_iter, Arc::clone(&self.columns));
         let mut matches = Vec::new();
         for spectrum in iter {
             let spectrum = spectrum?;
@@ -205,6 +215,7 @@ impl MzPeakReader {
 #[derive(Debug, Clone)]
 pub struct SpectrumArraysView {
     segments: Vec<SpectrumArraysViewSegment>,
+    columns: Arc<PeakColumns>,
     /// Unique spectrum identifier.
     pub spectrum_id: i64,
     /// Native scan number from the instrument.
@@ -252,7 +263,10 @@ struct SpectrumArraysViewSegment {
 }
 
 impl SpectrumArraysView {
-    fn from_segments(segments: Vec<SpectrumArraysViewSegment>) -> Result<Self, ReaderError> {
+    fn from_segments(
+        segments: Vec<SpectrumArraysViewSegment>,
+        peak_columns: Arc<PeakColumns>,
+    ) -> Result<Self, ReaderError> {
         let (batch, row) = {
             let first = segments.first().ok_or_else(|| {
                 ReaderError::InvalidFormat("empty spectrum view segments".to_string())
@@ -260,34 +274,37 @@ impl SpectrumArraysView {
             (first.batch.clone(), first.start)
         };
 
-        let spectrum_ids = get_int64_column(&batch, columns::SPECTRUM_ID)?;
-        let scan_numbers = get_int64_column(&batch, columns::SCAN_NUMBER)?;
-        let ms_levels = get_int16_column(&batch, columns::MS_LEVEL)?;
-        let retention_times = get_float32_column(&batch, columns::RETENTION_TIME)?;
-        let polarities = get_int8_column(&batch, columns::POLARITY)?;
-
-        let precursor_mzs = get_optional_float64_column(&batch, columns::PRECURSOR_MZ);
-        let precursor_charges = get_optional_int16_column(&batch, columns::PRECURSOR_CHARGE);
+        let cols = &*peak_columns;
+        let spectrum_ids =
+            column_at::<Int64Array>(&batch, cols.spectrum_id, columns::SPECTRUM_ID)?;
+        let scan_numbers =
+            column_at::<Int64Array>(&batch, cols.scan_number, columns::SCAN_NUMBER)?;
+        let ms_levels = column_at::<Int16Array>(&batch, cols.ms_level, columns::MS_LEVEL)?;
+        let retention_times =
+            column_at::<Float32Array>(&batch, cols.retention_time, columns::RETENTION_TIME)?;
+        let polarities = column_at::<Int8Array>(&batch, cols.polarity, columns::POLARITY)?;
+
+        let precursor_mzs = optional_column_at::<Float64Array>(&batch, cols.precursor_mz);
+        let precursor_charges = optional_column_at::<Int16Array>(&batch, cols.precursor_charge);
         let precursor_intensities =
-            get_optional_float32_column(&batch, columns::PRECURSOR_INTENSITY);
+            optional_column_at::<Float32Array>(&batch, cols.precursor_intensity);
         let isolation_lowers =
-            get_optional_float32_column(&batch, columns::ISOLATION_WINDOW_LOWER);
+            optional_column_at::<Float32Array>(&batch, cols.isolation_window_lower);
         let isolation_uppers =
-            get_optional_float32_column(&batch, columns::ISOLATION_WINDOW_UPPER);
-        let collision_energies = get_optional_float32_column(&batch, columns::COLLISION_ENERGY);
-        let tics = get_optional_float64_column(&batch, columns::TOTAL_ION_CURRENT);
-        let base_peak_mzs = get_optional_float64_column(&batch, columns::BASE_PEAK_MZ);
+            optional_column_at::<Float32Array>(&batch, cols.isolation_window_upper);
+        let collision_energies = optional_column_at::<Float32Array>(&batch, cols.collision_energy);
+        let tics = optional_column_at::<Float64Array>(&batch, cols.total_ion_current);
+        let base_peak_mzs = optional_column_at::<Float64Array>(&batch, cols.base_peak_mz);
         let base_peak_intensities =
-            get_optional_float32_column(&batch, columns::BASE_PEAK_INTENSITY);
-        let injection_times = get_optional_float32_column(&batch, columns::INJECTION_TIME);
-        let pixel_xs = get_optional_int32_column(&batch, columns::PIXEL_X);
-        let pixel_ys = get_optional_int32_column(&batch, columns::PIXEL_Y);
-        let pixel_zs = get_optional_int32_column(&batch, columns::PIXEL_Z);
+            optional_column_at::<Float32Array>(&batch, cols.base_peak_intensity);
+        let injection_times = optional_column_at::<Float32Array>(&batch, cols.injection_time);
+        let pixel_xs = optional_column_at::<Int32Array>(&batch, cols.pixel_x);
+        let pixel_ys = optional_column_at::<Int32Array>(&batch, cols.pixel_y);
+        let pixel_zs = optional_column_at::<Int32Array>(&batch, cols.pixel_z);
 
         let num_peaks = segments.iter().map(|s| s.len).sum();
 
         Ok(Self {
-            segments,
             spectrum_id: spectrum_ids.value(row),
             scan_number: scan_numbers.value(row),
             ms_level: ms_levels.value(row),
@@ -306,6 +323,8 @@ impl SpectrumArraysView {
             pixel_x: get_optional_i32(pixel_xs, row),
             pixel_y: get_optional_i32(pixel_ys, row),
             pixel_z: get_optional_i32(pixel_zs, row),
+            segments,
+            columns: peak_columns,
             num_peaks,
         })
     }
@@ -319,7 +338,9 @@ impl SpectrumArraysView {
     pub fn mz_arrays(&self) -> Result<Vec<Float64Array>, ReaderError> {
         self.segments
             .iter()
-            .map(|seg| slice_float64_column(&seg.batch, columns::MZ, seg.start, seg.len))
+            .map(|seg| {
+                slice_column::<Float64Type>(&seg.batch, self.columns.mz, columns::MZ, seg.start, seg.len)
+            })
             .collect()
     }
 
@@ -327,7 +348,15 @@ impl SpectrumArraysView {
     pub fn intensity_arrays(&self) -> Result<Vec<Float32Array>, ReaderError> {
         self.segments
             .iter()
-            .map(|seg| slice_float32_column(&seg.batch, columns::INTENSITY, seg.start, seg.len))
+            .map(|seg| {
+                slice_column::<Float32Type>(
+                    &seg.batch,
+                    self.columns.intensity,
+                    columns::INTENSITY,
+                    seg.start,
+                    seg.len,
+                )
+            })
             .collect()
     }
 
@@ -335,8 +364,8 @@ impl SpectrumArraysView {
     pub fn ion_mobility_arrays(&self) -> Result<Option<Vec<Float64Array>>, ReaderError> {
         let mut arrays = Vec::with_capacity(self.segments.len());
         for seg in &self.segments {
-            match slice_optional_float64_column(&seg.batch, columns::ION_MOBILITY, seg.start, seg.len)? {
-                Some(array) => arrays.push(array),
+            match optional_column_at::<Float64Array>(&seg.batch, self.columns.ion_mobility) {
+                Some(column) => arrays.push(column.slice(seg.start, seg.len)),
                 None => return Ok(None),
             }
         }
@@ -348,7 +377,9 @@ impl SpectrumArraysView {
         let has_ion_mobility = self
             .segments
             .first()
-            .and_then(|seg| get_optional_float64_column(&seg.batch, columns::ION_MOBILITY))
+            .and_then(|seg| {
+                optional_column_at::<Float64Array>(&seg.batch, self.columns.ion_mobility)
+            })
             .is_some();
 
         let mut builder = SpectrumArraysBuilder::new(
@@ -373,77 +404,37 @@ impl SpectrumArraysView {
             has_ion_mobility,
         );
 
+        builder.reserve(self.num_peaks);
         for seg in &self.segments {
             let batch = &seg.batch;
-            let mzs = get_float64_column(batch, columns::MZ)?;
-            let intensities = get_float32_column(batch, columns::INTENSITY)?;
-            let ion_mobilities = get_optional_float64_column(batch, columns::ION_MOBILITY);
-
-            for i in seg.start..seg.start + seg.len {
-                builder.push_peak(
-                    mzs.value(i),
-                    intensities.value(i),
-                    get_optional_f64(ion_mobilities, i),
-                );
-            }
+            let mzs = column_at::<Float64Array>(batch, self.columns.mz, columns::MZ)?;
+            let intensities =
+                column_at::<Float32Array>(batch, self.columns.intensity, columns::INTENSITY)?;
+            let ion_mobilities =
+                optional_column_at::<Float64Array>(batch, self.columns.ion_mobility);
+
+            builder.extend_segment(mzs, intensities, ion_mobilities, seg.start, seg.len);
         }
 
         Ok(builder.finish())
     }
 }
 
-fn slice_float64_column(
+/// Zero-copy slice of a required primitive column
+fn slice_column<T: ArrowPrimitiveType>(
     batch: &RecordBatch,
+    index: Option<usize>,
     name: &str,
     start: usize,
     len: usize,
-) -> Result<Float64Array, ReaderError> {
-    let column = get_float64_column(batch, name)?;
-    let array = column.slice(start, len);
-    array
-        .as_any()
-        .downcast_ref::<Float64Array>()
-        .ok_or_else(|| ReaderError::InvalidFormat(format!("{} is not Float64", name)))
-        .cloned()
-}
-
-fn slice_float32_column(
-    batch: &RecordBatch,
-    name: &str,
-    start: usize,
-    len: usize,
-) -> Result<Float32Array, ReaderError> {
-    let column = get_float32_column(batch, name)?;
-    let array = column.slice(start, len);
-    array
-        .as_any()
-        .downcast_ref::<Float32Array>()
-        .ok_or_else(|| ReaderError::InvalidFormat(format!("{} is not Float32", name)))
-        .cloned()
-}
-
-fn slice_optional_float64_column(
-    batch: &RecordBatch,
-    name: &str,
-    start: usize,
-    len: usize,
-) -> Result<Option<Float64Array>, ReaderError> {
-    let column = match get_optional_float64_column(batch, name) {
-        Some(column) => column,
-        None => return Ok(None),
-    };
-    let array = column.slice(start, len);
-    let array = array
-        .as_any()
-        .downcast_ref::<Float64Array>()
-        .ok_or_else(|| ReaderError::InvalidFormat(format!("{} is not Float64", name)))?
-        .clone();
-    Ok(Some(array))
+) -> Result<PrimitiveArray<T>, ReaderError> {
+    Ok(column_at::<PrimitiveArray<T>>(batch, index, name)?.slice(start, len))
 }
 
 /// Streaming iterator over spectra as view-backed SoA layout
 pub struct StreamingSpectrumArraysViewIterator {
     batch_iter: super::batches::RecordBatchIterator,
+    columns: Arc<PeakColumns>,
     current_batch: Option<RecordBatch>,
     current_row: usize,
     pending: Option<SpectrumArraysViewBuilder>,
@@ -452,9 +443,13 @@ pub struct StreamingSpectrumArraysViewIterator {
 }
 
 impl StreamingSpectrumArraysViewIterator {
-    pub(super) fn new(batch_iter: super::batches::RecordBatchIterator) -> Self {
+    pub(super) fn new(
+        batch_iter: super::batches::RecordBatchIterator,
+        columns: Arc<PeakColumns>,
+    ) -> Self {
         Self {
             batch_iter,
+            columns,
             current_batch: None,
             current_row: 0,
             pending: None,
@@ -496,14 +491,14 @@ impl Iterator for StreamingSpectrumArraysViewIterator {
                     return self
                         .pending
                         .take()
-                        .map(|pending| pending.finish().map_err(|e| e));
+                        .map(|pending| pending.finish(&self.columns).map_err(|e| e));
                 }
                 self.current_batch = self.load_next_batch();
                 if self.current_batch.is_none() {
                     return self
                         .pending
                         .take()
-                        .map(|pending| pending.finish().map_err(|e| e));
+                        .map(|pending| pending.finish(&self.columns).map_err(|e| e));
                 }
             }
 
@@ -514,7 +509,11 @@ impl Iterator for StreamingSpectrumArraysViewIterator {
                 continue;
             }
 
-            let spectrum_ids = match get_int64_column(batch, columns::SPECTRUM_ID) {
+            let spectrum_ids = match column_at::<Int64Array>(
+                batch,
+                self.columns.spectrum_id,
+                columns::SPECTRUM_ID,
+            ) {
                 Ok(col) => col,
                 Err(e) => return Some(Err(e)),
             };
@@ -533,7 +532,7 @@ impl Iterator for StreamingSpectrumArraysViewIterator {
                     self.pending = Some(SpectrumArraysViewBuilder::new(spectrum_id));
                 }
                 Some(pending) if pending.spectrum_id != spectrum_id => {
-                    let completed = match self.pending.take().unwrap().finish() {
+                    let completed = match self.pending.take().unwrap().finish(&self.columns) {
                         Ok(view) => view,
                         Err(e) => return Some(Err(e)),
                     };
@@ -573,8 +572,8 @@ impl SpectrumArraysViewBuilder {
         });
     }
 
-    fn finish(self) -> Result<SpectrumArraysView, ReaderError> {
-        SpectrumArraysView::from_segments(self.segments)
+    fn finish(self, peak_columns: &Arc<PeakColumns>) -> Result<SpectrumArraysView, ReaderError> {
+        SpectrumArraysView::from_segments(self.segments, Arc::clone(peak_columns))
     }
 }
 
@@ -654,11 +653,31 @@ impl SpectrumArraysBuilder {
         }
     }
 
-    fn push_peak(&mut self, mz: f64, intensity: f32, ion_mobility: Option<f64>) {
-        self.mz.push(mz);
-        self.intensity.push(intensity);
+    fn reserve(&mut self, additional: usize) {
+        self.mz.reserve_exact(additional);
+        self.intensity.reserve_exact(additional);
+        if let Some(ref mut buffer) = self.ion_mobility {
+            buffer.values.reserve_exact(additional);
+            buffer.validity.reserve_exact(additional);
+        }
+    }
+
+    /// Append one segment's peaks, copying the m/z and intensity runs in bulk.
+    fn extend_segment(
+        &mut self,
+        mzs: &Float64Array,
+        intensities: &Float32Array,
+        ion_mobilities: Option<&Float64Array>,
+        start: usize,
+        len: usize,
+    ) {
+        let range = start..start + len;
+        self.mz.extend_from_slice(&mzs.values()[range.clone()]);
+        self.intensity.extend_from_slice(&intensities.values()[range.clone()]);
         if let Some(ref mut buffer) = self.ion_mobility {
-            buffer.push(ion_mobility);
+            for i in range {
+                buffer.push(get_optional_f64(ion_mobilities, i));
+            }
         }
     }
 
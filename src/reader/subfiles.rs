@@ -14,7 +14,9 @@ impl MzPeakReader {
     /// Open a sub-parquet file (chromatograms or mobilograms) from the dataset
     fn open_sub_parquet(&self, subpath: &str) -> Result<Option<Vec<RecordBatch>>, ReaderError> {
         match &self.source {
-            ReaderSource::FilePath(path) => {
+            // A caller-supplied buffer has no dataset around it
+            ReaderSource::InMemory { path: None, .. } => Ok(None),
+            ReaderSource::FilePath(path) | ReaderSource::InMemory { path: Some(path), .. } => {
                 let sub_file_path = if path.is_dir() {
                     // Directory bundle
                     path.join(subpath)
@@ -74,8 +76,9 @@ impl MzPeakReader {
                     Err(_) => return Ok(None), // File doesn't exist in ZIP, return None
                 };
 
-                // Read the parquet file into memory
-                let mut parquet_bytes = Vec::new();
+                // Read the parquet file into memory, sized up front so the
+                // buffer is not regrown
+                let mut parquet_bytes = Vec::with_capacity(sub_file.size() as usize);
                 sub_file.read_to_end(&mut parquet_bytes)?;
 
                 // Parse as Parquet
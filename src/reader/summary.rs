@@ -1,5 +1,16 @@
 use std::fmt;
+use std::fs::File;
 
+use parquet::arrow::arrow_reader::ParquetRecordBatchReaderBuilder;
+use parquet::arrow::ProjectionMask;
+use parquet::file::metadata::ParquetMetaData;
+use parquet::file::reader::ChunkReader;
+use parquet::file::statistics::Statistics;
+
+use crate::schema::columns;
+
+use super::config::ReaderSource;
+use super::utils::{get_float32_column, get_float64_column, get_int16_column, get_int64_column};
 use super::{MzPeakReader, ReaderError};
 
 /// Summary statistics about an mzPeak file
@@ -23,59 +34,262 @@ pub struct FileSummary {
 
 impl MzPeakReader {
     /// Get summary statistics about the file
+    ///
+    /// RT and m/z ranges come from the row-group statistics in the footer.
+    /// Spectrum counts need the `spectrum_id` and `ms_level` columns, so only
+    /// those are decoded; peak values are read only when the file was written
+    /// without statistics.
     pub fn summary(&self) -> Result<FileSummary, ReaderError> {
-        let spectra = self.iter_spectra_arrays()?;
-
-        let num_spectra = spectra.len() as i64;
-        let num_ms1 = spectra.iter().filter(|s| s.ms_level == 1).count() as i64;
-        let num_ms2 = spectra.iter().filter(|s| s.ms_level == 2).count() as i64;
-
-        let rt_range = if !spectra.is_empty() {
-            let min_rt = spectra
-                .iter()
-                .map(|s| s.retention_time)
-                .fold(f32::MAX, f32::min);
-            let max_rt = spectra
-                .iter()
-                .map(|s| s.retention_time)
-                .fold(f32::MIN, f32::max);
-            Some((min_rt, max_rt))
-        } else {
-            None
-        };
-
-        let mz_range = if !spectra.is_empty() {
-            let mut min_mz = f64::MAX;
-            let mut max_mz = f64::MIN;
-            for spectrum in &spectra {
-                for array in spectrum.mz_arrays()? {
-                    for mz in array.values() {
-                        min_mz = min_mz.min(*mz);
-                        max_mz = max_mz.max(*mz);
-                    }
-                }
+        let counts = match &self.source {
+            ReaderSource::FilePath(path) => {
+                let file = File::open(path)?;
+                let builder = ParquetRecordBatchReaderBuilder::try_new(file)?
+                    .with_batch_size(self.config.batch_size);
+                summarize_rows(builder)?
+            }
+            ReaderSource::InMemory { data, .. } => {
+                let builder = ParquetRecordBatchReaderBuilder::try_new(data.clone())?
+                    .with_batch_size(self.config.batch_size);
+                summarize_rows(builder)?
             }
-            if min_mz <= max_mz {
-                Some((min_mz, max_mz))
-            } else {
-                None
+            ReaderSource::ZipContainer { chunk_reader, .. } => {
+                let builder = ParquetRecordBatchReaderBuilder::try_new(chunk_reader.clone())?
+                    .with_batch_size(self.config.batch_size);
+                summarize_rows(builder)?
             }
-        } else {
-            None
         };
 
         Ok(FileSummary {
             total_peaks: self.file_metadata.total_rows,
-            num_spectra,
-            num_ms1_spectra: num_ms1,
-            num_ms2_spectra: num_ms2,
-            rt_range,
-            mz_range,
+            num_spectra: counts.num_spectra,
+            num_ms1_spectra: counts.num_ms1_spectra,
+            num_ms2_spectra: counts.num_ms2_spectra,
+            rt_range: counts.rt_range,
+            mz_range: counts.mz_range,
             format_version: self.file_metadata.format_version.clone(),
         })
     }
 }
 
+/// The parts of a [`FileSummary`] that depend on the peak table contents
+struct RowSummary {
+    num_spectra: i64,
+    num_ms1_spectra: i64,
+    num_ms2_spectra: i64,
+    rt_range: Option<(f32, f32)>,
+    mz_range: Option<(f64, f64)>,
+}
+
+fn summarize_rows<T: ChunkReader + 'static>(
+    builder: ParquetRecordBatchReaderBuilder<T>,
+) -> Result<RowSummary, ReaderError> {
+    let metadata = builder.metadata().clone();
+    let schema_descr = metadata.file_metadata().schema_descr();
+    let leaf_index = |name: &str| {
+        schema_descr
+            .columns()
+            .iter()
+            .position(|column| column.name() == name)
+            .ok_or_else(|| ReaderError::ColumnNotFound(name.to_string()))
+    };
+
+    let mut summary = RowSummary {
+        num_spectra: 0,
+        num_ms1_spectra: 0,
+        num_ms2_spectra: 0,
+        rt_range: None,
+        mz_range: None,
+    };
+    if metadata.file_metadata().num_rows() == 0 {
+        return Ok(summary);
+    }
+
+    let rt_index = leaf_index(columns::RETENTION_TIME)?;
+    let mz_index = leaf_index(columns::MZ)?;
+    let rt_from_stats = column_range_from_statistics(&metadata, rt_index);
+    let mz_from_stats = column_range_from_statistics(&metadata, mz_index);
+
+    let mut leaves = vec![
+        leaf_index(columns::SPECTRUM_ID)?,
+        leaf_index(columns::MS_LEVEL)?,
+    ];
+    if rt_from_stats.is_none() {
+        leaves.push(rt_index);
+    }
+    if mz_from_stats.is_none() {
+        leaves.push(mz_index);
+    }
+
+    let projection = ProjectionMask::leaves(schema_descr, leaves);
+    let reader = builder.with_projection(projection).build()?;
+
+    let mut last_id = None;
+    let mut rt_bounds = (f32::MAX, f32::MIN);
+    let mut mz_bounds = (f64::MAX, f64::MIN);
+    for batch in reader {
+        let batch = batch?;
+        let ids = get_int64_column(&batch, columns::SPECTRUM_ID)?;
+        let levels = get_int16_column(&batch, columns::MS_LEVEL)?;
+        let rts = match rt_from_stats {
+            Some(_) => None,
+            None => Some(get_float32_column(&batch, columns::RETENTION_TIME)?),
+        };
+
+        for (row, &id) in ids.values().iter().enumerate() {
+            if last_id == Some(id) {
+                continue;
+            }
+            last_id = Some(id);
+            summary.num_spectra += 1;
+            match levels.value(row) {
+                1 => summary.num_ms1_spectra += 1,
+                2 => summary.num_ms2_spectra += 1,
+                _ => {}
+            }
+            if let Some(rts) = rts {
+                let rt = rts.value(row);
+                rt_bounds = (rt_bounds.0.min(rt), rt_bounds.1.max(rt));
+            }
+        }
+
+        if mz_from_stats.is_none() {
+            let mzs = get_float64_column(&batch, columns::MZ)?;
+            for &mz in mzs.values() {
+                mz_bounds = (mz_bounds.0.min(mz), mz_bounds.1.max(mz));
+            }
+        }
+    }
+
+    summary.rt_range = match rt_from_stats {
+        Some((min, max)) => Some((min as f32, max as f32)),
+        None if rt_bounds.0 <= rt_bounds.1 => Some(rt_bounds),
+        None => None,
+    };
+    summary.mz_range = match mz_from_stats {
+        Some(range) => Some(range),
+        None if mz_bounds.0 <= mz_bounds.1 => Some(mz_bounds),
+        None => None,
+    };
+
+    Ok(summary)
+}
+
+/// Combine exact per-row-group min/max statistics of a float column
+///
+/// Returns `None` if any non-empty row group lacks exact statistics, in which
+/// case the caller has to scan the column.
+fn column_range_from_statistics(
+    metadata: &ParquetMetaData,
+    column_index: usize,
+) -> Option<(f64, f64)> {
+    let mut range: Option<(f64, f64)> = None;
+    for row_group in metadata.row_groups() {
+        if row_group.num_rows() == 0 {
+            continue;
+        }
+        let (min, max) = match row_group.column(column_index).statistics()? {
+            Statistics::Float(stats) if stats.min_is_exact() && stats.max_is_exact() => {
+                (f64::from(*stats.min_opt()?), f64::from(*stats.max_opt()?))
+            }
+            Statistics::Double(stats) if stats.min_is_exact() && stats.max_is_exact() => {
+                (*stats.min_opt()?, *stats.max_opt()?)
+            }
+            _ => return None,
+        };
+        range = Some(match range {
+            Some((lo, hi)) => (lo.min(min), hi.max(max)),
+            None => (min, max),
+        });
+    }
+    range
+}
+
+impl MzPeakReader {
+    /// Count the peaks belonging to spectra of the given MS level
+    ///
+    /// Only the `ms_level` column is read, and row groups whose statistics
+    /// show a single MS level are counted from the footer without decoding.
+    /// No per-spectrum views are built.
+    pub fn peak_count_by_ms_level(&self, ms_level: i16) -> Result<i64, ReaderError> {
+        match &self.source {
+            ReaderSource::FilePath(path) => {
+                let file = File::open(path)?;
+                let builder = ParquetRecordBatchReaderBuilder::try_new(file)?
+                    .with_batch_size(self.config.batch_size);
+                count_ms_level_rows(builder, ms_level)
+            }
+            ReaderSource::InMemory { data, .. } => {
+                let builder = ParquetRecordBatchReaderBuilder::try_new(data.clone())?
+                    .with_batch_size(self.config.batch_size);
+                count_ms_level_rows(builder, ms_level)
+            }
+            ReaderSource::ZipContainer { chunk_reader, .. } => {
+                let builder = ParquetRecordBatchReaderBuilder::try_new(chunk_reader.clone())?
+                    .with_batch_size(self.config.batch_size);
+                count_ms_level_rows(builder, ms_level)
+            }
+        }
+    }
+}
+
+fn count_ms_level_rows<T: ChunkReader + 'static>(
+    builder: ParquetRecordBatchReaderBuilder<T>,
+    ms_level: i16,
+) -> Result<i64, ReaderError> {
+    let metadata = builder.metadata().clone();
+    let schema_descr = metadata.file_metadata().schema_descr();
+    let column_index = schema_descr
+        .columns()
+        .iter()
+        .position(|column| column.name() == columns::MS_LEVEL)
+        .ok_or_else(|| ReaderError::ColumnNotFound(columns::MS_LEVEL.to_string()))?;
+
+    // Int16 is stored with the INT32 physical type
+    let target = i32::from(ms_level);
+    let mut total = 0i64;
+    let mut row_groups_to_scan = Vec::new();
+
+    for i in 0..metadata.num_row_groups() {
+        let row_group = metadata.row_group(i);
+        match row_group.column(column_index).statistics() {
+            Some(Statistics::Int32(stats))
+                if stats.min_is_exact()
+                    && stats.max_is_exact()
+                    && stats.null_count_opt() == Some(0) =>
+            {
+                match (stats.min_opt(), stats.max_opt()) {
+                    (Some(&min), Some(&max)) if target < min || target > max => {}
+                    (Some(&min), Some(&max)) if min == max => total += row_group.num_rows(),
+                    _ => row_groups_to_scan.push(i),
+                }
+            }
+            _ => row_groups_to_scan.push(i),
+        }
+    }
+
+    if row_groups_to_scan.is_empty() {
+        return Ok(total);
+    }
+
+    let projection = ProjectionMask::leaves(schema_descr, [column_index]);
+    let reader = builder
+        .with_projection(projection)
+        .with_row_groups(row_groups_to_scan)
+        .build()?;
+
+    for batch in reader {
+        let batch = batch?;
+        let levels = get_int16_column(&batch, columns::MS_LEVEL)?;
+        total += levels
+            .values()
+            .iter()
+            .filter(|&&level| level == ms_level)
+            .count() as i64;
+    }
+
+    Ok(total)
+}
+
 impl fmt::Display for FileSummary {
     fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
         writeln!(f, "mzPeak File Summary")?;
@@ -77,36 +77,132 @@ fn test_get_spectrum_by_id() -> Result<(), Box<dyn std::error::Error>> {
 
 #[test]
 fn test_file_summary() -> Result<(), Box<dyn std::error::Error>> {
+    // Ranges come from footer statistics when present and from a column scan otherwise
+    for write_statistics in [true, false] {
+        let dir = tempdir()?;
+        let path = dir.path().join("test.parquet");
+
+        let metadata = MzPeakMetadata::new();
+        let config = WriterConfig {
+            write_statistics,
+            ..WriterConfig::default()
+        };
+        let mut writer = MzPeakWriter::new_file(&path, &metadata, config)?;
+
+        // Write 5 MS1 and 5 MS2 spectra
+        for i in 0..10 {
+            let ms_level = if i % 2 == 0 { 1 } else { 2 };
+            let peaks = PeakArrays::new(vec![400.0 + i as f64 * 100.0], vec![1000.0]);
+            let spectrum = if ms_level == 2 {
+                let mut ms2 = SpectrumArrays::new_ms2(i, i + 1, i as f32 * 10.0, 1, 450.0, peaks);
+                ms2.precursor_charge = Some(2);
+                ms2
+            } else {
+                SpectrumArrays::new_ms1(i, i + 1, i as f32 * 10.0, 1, peaks)
+            };
+
+            writer.write_spectrum_arrays(&spectrum)?;
+        }
+        writer.finish()?;
+
+        let reader = MzPeakReader::open(&path)?;
+        let summary = reader.summary()?;
+
+        assert_eq!(summary.num_spectra, 10);
+        assert_eq!(summary.num_ms1_spectra, 5);
+        assert_eq!(summary.num_ms2_spectra, 5);
+        assert_eq!(summary.total_peaks, 10);
+        assert_eq!(summary.rt_range, Some((0.0, 90.0)));
+        assert_eq!(summary.mz_range, Some((400.0, 1300.0)));
+    }
+
+    Ok(())
+}
+
+#[test]
+fn test_batch_cache() -> Result<(), Box<dyn std::error::Error>> {
+    use arrow::array::Array;
+
     let dir = tempdir()?;
     let path = dir.path().join("test.parquet");
 
     let metadata = MzPeakMetadata::new();
-    let config = WriterConfig::default();
+    let mut writer = MzPeakWriter::new_file(&path, &metadata, WriterConfig::default())?;
+    let peaks = PeakArrays::new(vec![100.0, 200.0, 300.0], vec![10.0, 20.0, 30.0]);
+    writer.write_spectrum_arrays(&SpectrumArrays::new_ms1(0, 1, 10.0, 1, peaks))?;
+    writer.finish()?;
+
+    let config = ReaderConfig {
+        cache_batches: true,
+        ..Default::default()
+    };
+    let mut reader = MzPeakReader::open_with_config(&path, config)?;
+
+    let first = reader.read_all_batches()?;
+    let second = reader.read_all_batches()?;
+    assert_eq!(first.len(), second.len());
+    // Cached batches share their buffers rather than being decoded again
+    assert!(first[0]
+        .column(0)
+        .to_data()
+        .ptr_eq(&second[0].column(0).to_data()));
+    assert_eq!(reader.iter_spectra_arrays()?.len(), 1);
+
+    reader.drop_cache();
+    let third = reader.read_all_batches()?;
+    assert!(!first[0]
+        .column(0)
+        .to_data()
+        .ptr_eq(&third[0].column(0).to_data()));
+
+    Ok(())
+}
+
+#[test]
+fn test_from_bytes() -> Result<(), Box<dyn std::error::Error>> {
+    let metadata = MzPeakMetadata::new();
+    let mut writer = MzPeakWriter::new(Vec::new(), &metadata, WriterConfig::default())?;
+    let peaks = PeakArrays::new(vec![100.0, 200.0], vec![10.0, 20.0]);
+    writer.write_spectrum_arrays(&SpectrumArrays::new_ms1(0, 1, 10.0, 1, peaks))?;
+    let buffer = writer.finish_into_inner()?;
+
+    let reader = MzPeakReader::from_bytes(buffer)?;
+    assert_eq!(reader.total_peaks(), 2);
+    assert_eq!(reader.iter_spectra_arrays()?.len(), 1);
+    assert!(reader.read_chromatograms()?.is_empty());
+
+    Ok(())
+}
+
+#[test]
+fn test_peak_count_by_ms_level() -> Result<(), Box<dyn std::error::Error>> {
+    let dir = tempdir()?;
+    let path = dir.path().join("test.parquet");
+
+    let metadata = MzPeakMetadata::new();
+    let config = WriterConfig {
+        row_group_size: 4,
+        ..WriterConfig::default()
+    };
     let mut writer = MzPeakWriter::new_file(&path, &metadata, config)?;
 
-    // Write 5 MS1 and 5 MS2 spectra
+    // MS1 spectra carry 2 peaks, MS2 spectra carry 3 peaks
     for i in 0..10 {
-        let ms_level = if i % 2 == 0 { 1 } else { 2 };
-        let peaks = PeakArrays::new(vec![400.0 + i as f64 * 100.0], vec![1000.0]);
-        let spectrum = if ms_level == 2 {
-            let mut ms2 = SpectrumArrays::new_ms2(i, i + 1, i as f32 * 10.0, 1, 450.0, peaks);
-            ms2.precursor_charge = Some(2);
-            ms2
-        } else {
+        let spectrum = if i % 2 == 0 {
+            let peaks = PeakArrays::new(vec![400.0, 500.0], vec![1000.0, 2000.0]);
             SpectrumArrays::new_ms1(i, i + 1, i as f32 * 10.0, 1, peaks)
+        } else {
+            let peaks = PeakArrays::new(vec![200.0, 250.0, 300.0], vec![500.0, 1500.0, 750.0]);
+            SpectrumArrays::new_ms2(i, i + 1, i as f32 * 10.0, 1, 450.0, peaks)
         };
-
         writer.write_spectrum_arrays(&spectrum)?;
     }
     writer.finish()?;
 
     let reader = MzPeakReader::open(&path)?;
-    let summary = reader.summary()?;
-
-    assert_eq!(summary.num_spectra, 10);
-    assert_eq!(summary.num_ms1_spectra, 5);
-    assert_eq!(summary.num_ms2_spectra, 5);
-    assert_eq!(summary.total_peaks, 10);
+    assert_eq!(reader.peak_count_by_ms_level(1)?, 10);
+    assert_eq!(reader.peak_count_by_ms_level(2)?, 15);
+    assert_eq!(reader.peak_count_by_ms_level(3)?, 0);
 
     Ok(())
 }
@@ -154,7 +250,13 @@ fn test_spectrum_arrays_view_segments() -> Result<(), Box<dyn std::error::Error>
     writer.write_spectrum_arrays(&spectrum)?;
     writer.finish()?;
 
-    let reader = MzPeakReader::open_with_config(&path, ReaderConfig { batch_size: 2 })?;
+    let reader = MzPeakReader::open_with_config(
+        &path,
+        ReaderConfig {
+            batch_size: 2,
+            ..Default::default()
+        },
+    )?;
     let mut iter = reader.iter_spectra_arrays_streaming()?;
     let view = iter.next().unwrap()?;
 
@@ -1,5 +1,5 @@
 use arrow::array::{
-    Array, Float32Array, Float64Array, Int16Array, Int32Array, Int64Array, Int8Array, ListArray,
+    Array, Float32Array, Float64Array, Int16Array, Int32Array, Int64Array, ListArray,
     StringArray,
 };
 use arrow::record_batch::RecordBatch;
@@ -32,19 +32,6 @@ pub(super) fn get_int16_column<'a>(
         .ok_or_else(|| ReaderError::InvalidFormat(format!("{} is not Int16", name)))
 }
 
-/// Get a required Int8 column by name.
-pub(super) fn get_int8_column<'a>(
-    batch: &'a RecordBatch,
-    name: &str,
-) -> Result<&'a Int8Array, ReaderError> {
-    batch
-        .column_by_name(name)
-        .ok_or_else(|| ReaderError::ColumnNotFound(name.to_string()))?
-        .as_any()
-        .downcast_ref::<Int8Array>()
-        .ok_or_else(|| ReaderError::InvalidFormat(format!("{} is not Int8", name)))
-}
-
 /// Get a required Float32 column by name.
 pub(super) fn get_float32_column<'a>(
     batch: &'a RecordBatch,
@@ -71,38 +58,6 @@ pub(super) fn get_float64_column<'a>(
         .ok_or_else(|| ReaderError::InvalidFormat(format!("{} is not Float64", name)))
 }
 
-/// Get an optional Float64 column by name.
-pub(super) fn get_optional_float64_column<'a>(
-    batch: &'a RecordBatch,
-    name: &str,
-) -> Option<&'a Float64Array> {
-    batch.column_by_name(name)?.as_any().downcast_ref::<Float64Array>()
-}
-
-/// Get an optional Float32 column by name.
-pub(super) fn get_optional_float32_column<'a>(
-    batch: &'a RecordBatch,
-    name: &str,
-) -> Option<&'a Float32Array> {
-    batch.column_by_name(name)?.as_any().downcast_ref::<Float32Array>()
-}
-
-/// Get an optional Int16 column by name.
-pub(super) fn get_optional_int16_column<'a>(
-    batch: &'a RecordBatch,
-    name: &str,
-) -> Option<&'a Int16Array> {
-    batch.column_by_name(name)?.as_any().downcast_ref::<Int16Array>()
-}
-
-/// Get an optional Int32 column by name.
-pub(super) fn get_optional_int32_column<'a>(
-    batch: &'a RecordBatch,
-    name: &str,
-) -> Option<&'a Int32Array> {
-    batch.column_by_name(name)?.as_any().downcast_ref::<Int32Array>()
-}
-
 /// Read an optional f64 value from a nullable array.
 pub(super) fn get_optional_f64(array: Option<&Float64Array>, idx: usize) -> Option<f64> {
     array.and_then(|arr| if arr.is_null(idx) { None } else { Some(arr.value(idx)) })
@@ -155,7 +110,7 @@ pub(super) fn extract_f64_list(list_array: &ListArray, idx: usize) -> Vec<f64> {
     let float_array = values.as_any().downcast_ref::<Float64Array>().unwrap();
     let start = list_array.value_offsets()[idx] as usize;
     let end = list_array.value_offsets()[idx + 1] as usize;
-    (start..end).map(|i| float_array.value(i)).collect()
+    float_array.values()[start..end].to_vec()
 }
 
 /// Extract a f32 list from a list array row.
@@ -164,5 +119,5 @@ pub(super) fn extract_f32_list(list_array: &ListArray, idx: usize) -> Vec<f32> {
     let float_array = values.as_any().downcast_ref::<Float32Array>().unwrap();
     let start = list_array.value_offsets()[idx] as usize;
     let end = list_array.value_offsets()[idx + 1] as usize;
-    (start..end).map(|i| float_array.value(i)).collect()
+    float_array.values()[start..end].to_vec()
 }
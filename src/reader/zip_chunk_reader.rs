@@ -179,10 +179,21 @@ impl ChunkReader for ZipEntryChunkReader {
         let remaining = self.entry_size.saturating_sub(start) as usize;
         let actual_length = std::cmp::min(length, remaining);
 
-        let mut buf = vec![0u8; actual_length];
-        file.read_exact(&mut buf).map_err(|e| {
-            parquet::errors::ParquetError::General(format!("Failed to read from ZIP: {}", e))
-        })?;
+        // Read into spare capacity rather than a zeroed buffer: every byte is
+        // overwritten by the read, so zero-filling would be a wasted pass.
+        let mut buf = Vec::with_capacity(actual_length);
+        let read = (&mut file)
+            .take(actual_length as u64)
+            .read_to_end(&mut buf)
+            .map_err(|e| {
+                parquet::errors::ParquetError::General(format!("Failed to read from ZIP: {}", e))
+            })?;
+        if read != actual_length {
+            return Err(parquet::errors::ParquetError::EOF(format!(
+                "Unexpected end of ZIP entry: expected {} bytes, read {}",
+                actual_length, read
+            )));
+        }
 
         Ok(Bytes::from(buf))
     }
@@ -9,6 +9,13 @@
 //! within the same spectrum. This is in contrast to a "Wide" format where arrays would
 //! be stored as nested lists.
 //!
+//! A `LargeList<Float64>` per-spectrum layout was considered and rejected for this
+//! table: it would break the flat schema that DuckDB, Polars and the row-group
+//! statistics pruning rely on, and it buys little on read. Peaks of one spectrum are
+//! already contiguous, so readers slice each spectrum out of a decoded batch without
+//! copying (see `SpectrumArraysView`). Per-spectrum metadata normalization is what
+//! the v2.0 two-table layout (`spectra.parquet` + `peaks.parquet`) provides.
+//!
 //! ## Schema Columns
 //!
 //! | Column | Type | Description | CV Term |
@@ -43,6 +43,16 @@ impl CompressionType {
     }
 }
 
+fn parquet_compression(compression: CompressionType) -> Compression {
+    match compression {
+        CompressionType::Zstd(level) => {
+            Compression::ZSTD(ZstdLevel::try_new(level).unwrap_or(ZstdLevel::default()))
+        }
+        CompressionType::Snappy => Compression::SNAPPY,
+        CompressionType::Uncompressed => Compression::UNCOMPRESSED,
+    }
+}
+
 /// Configuration for the mzPeak writer
 #[derive(Debug, Clone)]
 pub struct WriterConfig {
@@ -71,6 +81,13 @@ pub struct WriterConfig {
     /// Default: true
     pub use_byte_stream_split: bool,
 
+    /// Compression for the low-cardinality metadata columns of the peak table
+    /// (ms_level, polarity, precursor_charge). Dictionary + RLE encoding
+    /// already shrinks these to a few bytes per page, so a codec mostly adds
+    /// per-page work. `None` applies `compression` to them as well.
+    /// Default: Some(Uncompressed)
+    pub metadata_compression: Option<CompressionType>,
+
     /// Buffer capacity for async writer pipeline (number of batches).
     /// Higher values reduce backpressure but use more memory.
     /// Default: 8
@@ -95,6 +112,8 @@ impl Default for WriterConfig {
             max_peaks_per_file: Some(50_000_000),
             // BYTE_STREAM_SPLIT improves compression for floating-point scientific data
             use_byte_stream_split: true,
+            // Tiny dictionary-encoded metadata columns skip the codec
+            metadata_compression: Some(CompressionType::Uncompressed),
             // Buffer 8 batches for async writer pipeline
             async_buffer_capacity: 8,
         }
@@ -112,6 +131,7 @@ impl WriterConfig {
             dictionary_page_size_limit: 2 * 1024 * 1024,
             max_peaks_per_file: Some(100_000_000),
             use_byte_stream_split: true,
+            metadata_compression: Some(CompressionType::Uncompressed),
             async_buffer_capacity: 8,
         }
     }
@@ -126,6 +146,7 @@ impl WriterConfig {
             dictionary_page_size_limit: 512 * 1024,
             max_peaks_per_file: Some(50_000_000),
             use_byte_stream_split: true,
+            metadata_compression: Some(CompressionType::Uncompressed),
             async_buffer_capacity: 16, // Larger buffer for fast writes
         }
     }
@@ -140,13 +161,7 @@ impl WriterConfig {
         &self,
         metadata: &HashMap<String, String>,
     ) -> WriterProperties {
-        let compression = match self.compression {
-            CompressionType::Zstd(level) => {
-                Compression::ZSTD(ZstdLevel::try_new(level).unwrap_or(ZstdLevel::default()))
-            }
-            CompressionType::Snappy => Compression::SNAPPY,
-            CompressionType::Uncompressed => Compression::UNCOMPRESSED,
-        };
+        let compression = parquet_compression(self.compression);
 
         let statistics = if self.write_statistics {
             EnabledStatistics::Chunk
@@ -165,6 +180,9 @@ impl WriterConfig {
         // These columns have the same value for all peaks in a spectrum, so dictionary
         // encoding + RLE will achieve excellent compression.
         // Note: Parquet automatically uses RLE for dictionary-encoded data.
+        // The Arrow schema keeps plain integer types for ms_level/polarity/charge;
+        // dictionary encoding happens here on disk, so readers and SQL engines
+        // see ordinary columns while low-cardinality runs still collapse.
         let dict_columns = [
             columns::SPECTRUM_ID,
             columns::SCAN_NUMBER,
@@ -194,6 +212,17 @@ impl WriterConfig {
             );
         }
 
+        if let Some(metadata_compression) = self.metadata_compression {
+            let low_cardinality_columns =
+                [columns::MS_LEVEL, columns::POLARITY, columns::PRECURSOR_CHARGE];
+            for col in low_cardinality_columns {
+                builder = builder.set_column_compression(
+                    ColumnPath::new(vec![col.to_string()]),
+                    parquet_compression(metadata_compression),
+                );
+            }
+        }
+
         // m/z, intensity, and ion_mobility columns: disable dictionary (high cardinality data)
         let float_columns = [columns::MZ, columns::INTENSITY, columns::ION_MOBILITY];
         for col in float_columns {
@@ -240,13 +269,7 @@ impl WriterConfig {
         &self,
         metadata: &HashMap<String, String>,
     ) -> WriterProperties {
-        let compression = match self.compression {
-            CompressionType::Zstd(level) => {
-                Compression::ZSTD(ZstdLevel::try_new(level).unwrap_or(ZstdLevel::default()))
-            }
-            CompressionType::Snappy => Compression::SNAPPY,
-            CompressionType::Uncompressed => Compression::UNCOMPRESSED,
-        };
+        let compression = parquet_compression(self.compression);
 
         let statistics = if self.write_statistics {
             EnabledStatistics::Chunk
@@ -309,13 +332,7 @@ impl WriterConfig {
         &self,
         metadata: &HashMap<String, String>,
     ) -> WriterProperties {
-        let compression = match self.compression {
-            CompressionType::Zstd(level) => {
-                Compression::ZSTD(ZstdLevel::try_new(level).unwrap_or(ZstdLevel::default()))
-            }
-            CompressionType::Snappy => Compression::SNAPPY,
-            CompressionType::Uncompressed => Compression::UNCOMPRESSED,
-        };
+        let compression = parquet_compression(self.compression);
 
         let statistics = if self.write_statistics {
             EnabledStatistics::Chunk
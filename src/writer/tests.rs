@@ -41,6 +41,83 @@ fn test_write_spectrum_arrays() -> Result<(), WriterError> {
     Ok(())
 }
 
+#[test]
+fn test_low_cardinality_columns_are_dictionary_encoded() -> Result<(), Box<dyn std::error::Error>> {
+    use crate::schema::columns;
+    use parquet::basic::Encoding;
+    use parquet::file::reader::{FileReader, SerializedFileReader};
+
+    let metadata = MzPeakMetadata::new();
+    let buffer = Cursor::new(Vec::new());
+    let mut writer = MzPeakWriter::new(buffer, &metadata, WriterConfig::default())?;
+
+    let spectra: Vec<SpectrumArrays> = (0..10)
+        .map(|i| {
+            let peaks = PeakArrays::new(vec![400.0, 500.0], vec![10.0, 20.0]);
+            if i % 2 == 0 {
+                SpectrumArrays::new_ms1(i, i + 1, i as f32, 1, peaks)
+            } else {
+                let mut spectrum = SpectrumArrays::new_ms2(i, i + 1, i as f32, 1, 450.0, peaks);
+                spectrum.precursor_charge = Some(2);
+                spectrum
+            }
+        })
+        .collect();
+    writer.write_spectra_arrays(&spectra)?;
+
+    let bytes = bytes::Bytes::from(writer.finish_into_inner()?.into_inner());
+    let reader = SerializedFileReader::new(bytes)?;
+    let row_group = reader.metadata().row_group(0);
+
+    for name in [columns::MS_LEVEL, columns::POLARITY, columns::PRECURSOR_CHARGE] {
+        let column = row_group
+            .columns()
+            .iter()
+            .find(|c| c.column_path().string() == name)
+            .expect("column present");
+        assert!(
+            column.encodings().contains(&Encoding::RLE_DICTIONARY),
+            "{} is not dictionary encoded: {:?}",
+            name,
+            column.encodings()
+        );
+    }
+
+    Ok(())
+}
+
+#[test]
+fn test_low_cardinality_columns_skip_compression() -> Result<(), Box<dyn std::error::Error>> {
+    use crate::schema::columns;
+    use parquet::basic::Compression;
+    use parquet::file::reader::{FileReader, SerializedFileReader};
+
+    let metadata = MzPeakMetadata::new();
+    let buffer = Cursor::new(Vec::new());
+    let mut writer = MzPeakWriter::new(buffer, &metadata, WriterConfig::default())?;
+
+    let peaks = PeakArrays::new(vec![400.0, 500.0], vec![10.0, 20.0]);
+    writer.write_spectrum_arrays(&SpectrumArrays::new_ms1(0, 1, 60.0, 1, peaks))?;
+
+    let bytes = bytes::Bytes::from(writer.finish_into_inner()?.into_inner());
+    let reader = SerializedFileReader::new(bytes)?;
+    let row_group = reader.metadata().row_group(0);
+    let compression_of = |name: &str| {
+        row_group
+            .columns()
+            .iter()
+            .find(|c| c.column_path().string() == name)
+            .map(|c| c.compression())
+            .expect("column present")
+    };
+
+    assert_eq!(compression_of(columns::MS_LEVEL), Compression::UNCOMPRESSED);
+    assert_eq!(compression_of(columns::POLARITY), Compression::UNCOMPRESSED);
+    assert!(matches!(compression_of(columns::MZ), Compression::ZSTD(_)));
+
+    Ok(())
+}
+
 #[test]
 fn test_write_owned_batch() -> Result<(), WriterError> {
     let metadata = MzPeakMetadata::new();